@@ -0,0 +1,17 @@
+"""Fast JSON and YAML parser selection shared by the client and validator."""
+
+try:
+    # orjson parses bytes directly and raises a JSONDecodeError subclass, so
+    # both parsers share a handler
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as json_loads
+
+try:
+    # libyaml-backed loader, several times faster than the pure Python one;
+    # reads bytes directly
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+__all__ = ["YamlLoader", "json_loads"]
@@ -1,14 +1,45 @@
 """HTTP client for fetching remote OpenAPI specifications."""
 
+import asyncio
+from collections.abc import Iterable
+from json import JSONDecodeError
 from typing import Any
 
 import httpx
 import yaml
 
+from ._parsing import YamlLoader, json_loads
 from .exceptions import FetchError, ParseError
 from .models import SpecificationMetadata
 
 
+def _check_structure(content: dict[str, Any], url: str) -> None:
+    """Check the fields every OpenAPI 3.x specification must have.
+
+    Args:
+        content: The parsed specification
+        url: The URL it was fetched from (used for error messages)
+
+    Raises:
+        ParseError: If a required field is missing or invalid
+    """
+    if "openapi" not in content:
+        raise ParseError("Missing required 'openapi' field", source=url)
+
+    openapi_version = content["openapi"]
+    if not isinstance(openapi_version, str):
+        raise ParseError("'openapi' field must be a string", source=url)
+
+    if not openapi_version.startswith("3."):
+        raise ParseError(
+            f"Unsupported OpenAPI version: {openapi_version}. Only 3.x is supported.",
+            source=url,
+        )
+
+    if "info" not in content:
+        raise ParseError("Missing required 'info' field", source=url)
+
+
 class OpenAPIClient:
     """Client for fetching OpenAPI specifications from remote URLs.
 
@@ -35,6 +66,7 @@ class OpenAPIClient:
         timeout: float = DEFAULT_TIMEOUT,
         headers: dict[str, str] | None = None,
         follow_redirects: bool = True,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize the OpenAPI client.
 
@@ -42,10 +74,12 @@ class OpenAPIClient:
             timeout: Request timeout in seconds
             headers: Additional headers to send with requests
             follow_redirects: Whether to follow HTTP redirects
+            transport: Optional httpx transport (e.g. httpx.MockTransport)
         """
         self._timeout = timeout
         self._headers = headers or {}
         self._follow_redirects = follow_redirects
+        self._transport = transport
 
     def _create_client(self) -> httpx.Client:
         """Create a configured httpx client."""
@@ -59,6 +93,7 @@ class OpenAPIClient:
             timeout=self._timeout,
             headers=default_headers,
             follow_redirects=self._follow_redirects,
+            transport=self._transport,
         )
 
     def _parse_content(
@@ -77,8 +112,6 @@ class OpenAPIClient:
         Raises:
             ParseError: If parsing fails
         """
-        content_str = content.decode("utf-8")
-
         # Determine format from content type or URL
         is_yaml = False
         if content_type:
@@ -96,16 +129,14 @@ class OpenAPIClient:
         # Try parsing
         try:
             if is_yaml:
-                result = yaml.safe_load(content_str)
+                result = yaml.load(content, Loader=YamlLoader)
             else:
-                # Try JSON first, fall back to YAML
-                import json
-
+                # Try JSON first, straight from the bytes, fall back to YAML
                 try:
-                    result = json.loads(content_str)
-                except json.JSONDecodeError:
+                    result = json_loads(content)
+                except JSONDecodeError:
                     # YAML is a superset of JSON, so try YAML
-                    result = yaml.safe_load(content_str)
+                    result = yaml.load(content, Loader=YamlLoader)
 
             if not isinstance(result, dict):
                 raise ParseError(
@@ -134,30 +165,34 @@ class OpenAPIClient:
             ParseError: If parsing the response fails
         """
         with self._create_client() as client:
-            try:
-                response = client.get(url)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                raise FetchError(url, "Request timed out")
-            except httpx.HTTPStatusError as e:
-                raise FetchError(url, f"HTTP {e.response.status_code}")
-            except httpx.RequestError as e:
-                raise FetchError(url, str(e))
-
-            content_type = (
-                response.headers.get("content-type", "").split(";")[0].strip()
-            )
-            etag = response.headers.get("etag")
-
-            content = self._parse_content(response.content, content_type, url)
-
-            metadata = SpecificationMetadata(
-                source_url=url,
-                content_type=content_type or None,
-                etag=etag,
-            )
-
-            return content, metadata
+            return self._fetch(client, url)
+
+    def _fetch(
+        self, client: httpx.Client, url: str
+    ) -> tuple[dict[str, Any], SpecificationMetadata]:
+        """Fetch and parse a specification with an already open httpx client."""
+        try:
+            response = client.get(url)
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            raise FetchError(url, "Request timed out")
+        except httpx.HTTPStatusError as e:
+            raise FetchError(url, f"HTTP {e.response.status_code}")
+        except httpx.RequestError as e:
+            raise FetchError(url, str(e))
+
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        etag = response.headers.get("etag")
+
+        content = self._parse_content(response.content, content_type, url)
+
+        metadata = SpecificationMetadata(
+            source_url=url,
+            content_type=content_type or None,
+            etag=etag,
+        )
+
+        return content, metadata
 
     def fetch_and_validate_structure(
         self, url: str
@@ -178,25 +213,31 @@ class OpenAPIClient:
             ParseError: If parsing or basic validation fails
         """
         content, metadata = self.fetch(url)
+        _check_structure(content, url)
+        return content, metadata
 
-        # Basic structural validation
-        if "openapi" not in content:
-            raise ParseError("Missing required 'openapi' field", source=url)
-
-        openapi_version = content["openapi"]
-        if not isinstance(openapi_version, str):
-            raise ParseError("'openapi' field must be a string", source=url)
+    def fetch_many_and_validate_structure(
+        self, urls: Iterable[str]
+    ) -> list[tuple[dict[str, Any], SpecificationMetadata]]:
+        """Fetch several OpenAPI specifications in turn over one connection pool.
 
-        if not openapi_version.startswith("3."):
-            raise ParseError(
-                f"Unsupported OpenAPI version: {openapi_version}. Only 3.x is supported.",
-                source=url,
-            )
+        Args:
+            urls: The URLs to fetch the specifications from
 
-        if "info" not in content:
-            raise ParseError("Missing required 'info' field", source=url)
+        Returns:
+            (parsed_content, metadata) tuples in the order of urls
 
-        return content, metadata
+        Raises:
+            FetchError: If any HTTP request fails
+            ParseError: If parsing or basic validation of any specification fails
+        """
+        results = []
+        with self._create_client() as client:
+            for url in urls:
+                content, metadata = self._fetch(client, url)
+                _check_structure(content, url)
+                results.append((content, metadata))
+        return results
 
 
 class AsyncOpenAPIClient:
@@ -214,6 +255,7 @@ class AsyncOpenAPIClient:
         timeout: float = DEFAULT_TIMEOUT,
         headers: dict[str, str] | None = None,
         follow_redirects: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the async OpenAPI client.
 
@@ -221,10 +263,12 @@ class AsyncOpenAPIClient:
             timeout: Request timeout in seconds
             headers: Additional headers to send with requests
             follow_redirects: Whether to follow HTTP redirects
+            transport: Optional async httpx transport (e.g. httpx.MockTransport)
         """
         self._timeout = timeout
         self._headers = headers or {}
         self._follow_redirects = follow_redirects
+        self._transport = transport
 
     def _create_client(self) -> httpx.AsyncClient:
         """Create a configured async httpx client."""
@@ -238,6 +282,7 @@ class AsyncOpenAPIClient:
             timeout=self._timeout,
             headers=default_headers,
             follow_redirects=self._follow_redirects,
+            transport=self._transport,
         )
 
     def _parse_content(
@@ -262,30 +307,34 @@ class AsyncOpenAPIClient:
             ParseError: If parsing the response fails
         """
         async with self._create_client() as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                raise FetchError(url, "Request timed out")
-            except httpx.HTTPStatusError as e:
-                raise FetchError(url, f"HTTP {e.response.status_code}")
-            except httpx.RequestError as e:
-                raise FetchError(url, str(e))
-
-            content_type = (
-                response.headers.get("content-type", "").split(";")[0].strip()
-            )
-            etag = response.headers.get("etag")
-
-            content = self._parse_content(response.content, content_type, url)
-
-            metadata = SpecificationMetadata(
-                source_url=url,
-                content_type=content_type or None,
-                etag=etag,
-            )
-
-            return content, metadata
+            return await self._fetch(client, url)
+
+    async def _fetch(
+        self, client: httpx.AsyncClient, url: str
+    ) -> tuple[dict[str, Any], SpecificationMetadata]:
+        """Fetch and parse a specification with an already open httpx client."""
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            raise FetchError(url, "Request timed out")
+        except httpx.HTTPStatusError as e:
+            raise FetchError(url, f"HTTP {e.response.status_code}")
+        except httpx.RequestError as e:
+            raise FetchError(url, str(e))
+
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        etag = response.headers.get("etag")
+
+        content = self._parse_content(response.content, content_type, url)
+
+        metadata = SpecificationMetadata(
+            source_url=url,
+            content_type=content_type or None,
+            etag=etag,
+        )
+
+        return content, metadata
 
     async def fetch_and_validate_structure(
         self, url: str
@@ -303,22 +352,31 @@ class AsyncOpenAPIClient:
             ParseError: If parsing or basic validation fails
         """
         content, metadata = await self.fetch(url)
+        _check_structure(content, url)
+        return content, metadata
 
-        # Basic structural validation
-        if "openapi" not in content:
-            raise ParseError("Missing required 'openapi' field", source=url)
+    async def fetch_many_and_validate_structure(
+        self, urls: Iterable[str]
+    ) -> list[tuple[dict[str, Any], SpecificationMetadata]]:
+        """Fetch several OpenAPI specifications concurrently over one connection pool.
 
-        openapi_version = content["openapi"]
-        if not isinstance(openapi_version, str):
-            raise ParseError("'openapi' field must be a string", source=url)
+        Args:
+            urls: The URLs to fetch the specifications from
 
-        if not openapi_version.startswith("3."):
-            raise ParseError(
-                f"Unsupported OpenAPI version: {openapi_version}. Only 3.x is supported.",
-                source=url,
-            )
+        Returns:
+            (parsed_content, metadata) tuples in the order of urls
 
-        if "info" not in content:
-            raise ParseError("Missing required 'info' field", source=url)
+        Raises:
+            FetchError: If any HTTP request fails
+            ParseError: If parsing or basic validation of any specification fails
+        """
+        async with self._create_client() as client:
 
-        return content, metadata
+            async def fetch_one(
+                url: str,
+            ) -> tuple[dict[str, Any], SpecificationMetadata]:
+                content, metadata = await self._fetch(client, url)
+                _check_structure(content, url)
+                return content, metadata
+
+            return await asyncio.gather(*(fetch_one(url) for url in urls))
@@ -1,12 +1,17 @@
 """Immutable Pydantic models for OpenAPI specifications."""
 
+import re
+import sys
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from openapi_pydantic import OpenAPI as OpenAPI31
 from openapi_pydantic.v3.v3_0 import OpenAPI as OpenAPI30
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class ErrorSeverity(str, Enum):
@@ -48,12 +53,19 @@ class SpecificationType(str, Enum):
         Raises:
             ValueError: If the version is not supported
         """
-        if version.startswith("3.0"):
-            return cls.OPENAPI_3_0
-        elif version.startswith("3.1"):
-            return cls.OPENAPI_3_1
-        else:
+        match = _VERSION_PREFIX_RE.match(version)
+        if match is None:
             raise ValueError(f"Unsupported OpenAPI version: {version}")
+        return _MINOR_TO_TYPE[match["minor"]]
+
+
+# Version prefix recognized by SpecificationType.from_version; the captured
+# minor version selects the specification type
+_VERSION_PREFIX_RE = re.compile(r"3\.(?P<minor>[01])")
+_MINOR_TO_TYPE: dict[str, SpecificationType] = {
+    "0": SpecificationType.OPENAPI_3_0,
+    "1": SpecificationType.OPENAPI_3_1,
+}
 
 
 class SpecificationKey(BaseModel):
@@ -71,10 +83,26 @@ class SpecificationKey(BaseModel):
         ..., description="Semantic version of the specification (e.g., '3.0.3')"
     )
 
+    @field_validator("version")
+    @classmethod
+    def _intern_version(cls, value: str) -> str:
+        """Intern the version so keys for the same version share one string."""
+        return sys.intern(value)
+
     def __hash__(self) -> int:
         return hash((self.spec_type, self.version))
 
 
+@lru_cache(maxsize=256)
+def _spec_key(spec_type: SpecificationType, version: str) -> SpecificationKey:
+    """Return a shared SpecificationKey for a specification type and version.
+
+    Registry lookups reuse the cached key instead of validating a new
+    model on every call.
+    """
+    return SpecificationKey(spec_type=spec_type, version=version)
+
+
 class SpecificationMetadata(BaseModel):
     """Metadata about a stored OpenAPI specification.
 
@@ -172,11 +200,19 @@ class ValidationResult(BaseModel):
         validated_against: SpecificationKey | None = None,
         warnings: tuple[dict[str, Any], ...] = (),
     ) -> "ValidationResult":
-        """Create a successful validation result."""
-        return cls(
+        """Create a successful validation result.
+
+        Results without warnings are immutable and depend only on the
+        specification key, so a shared instance per key is returned.
+        """
+        if cls is ValidationResult and not warnings:
+            if validated_against is None:
+                return _SUCCESS
+            return _keyed_success(validated_against)
+        return cls.model_construct(
             is_valid=True,
             errors=(),
-            warnings=warnings,
+            warnings=tuple(warnings),
             validated_against=validated_against,
         )
 
@@ -187,11 +223,16 @@ class ValidationResult(BaseModel):
         validated_against: SpecificationKey | None = None,
         warnings: tuple[dict[str, Any], ...] = (),
     ) -> "ValidationResult":
-        """Create a failed validation result."""
-        return cls(
+        """Create a failed validation result.
+
+        Validators build many error dicts per document, so the arguments are
+        stored as given (packed into tuples) without a second pydantic
+        validation pass over every error.
+        """
+        return cls.model_construct(
             is_valid=False,
             errors=tuple(errors),
-            warnings=warnings,
+            warnings=tuple(warnings),
             validated_against=validated_against,
         )
 
@@ -225,6 +266,58 @@ class ValidationResult(BaseModel):
         """Get only informational errors."""
         return self.get_errors_by_severity(ErrorSeverity.INFO)
 
+    @property
+    def error_types(self) -> frozenset[str]:
+        """Get the set of error types present in the errors."""
+        return frozenset(error["type"] for error in self.errors if "type" in error)
+
+    def has_error_type(self, error_type: str) -> bool:
+        """Check whether any error has the given type.
+
+        Args:
+            error_type: The error type to look for (e.g., "type_mismatch")
+
+        Returns:
+            True if at least one error has that type
+        """
+        return any(error.get("type") == error_type for error in self.errors)
+
+    @property
+    def missing_paths(self) -> frozenset[str]:
+        """Get the required paths reported as missing.
+
+        Read from the ``required_path`` key of ``missing_required_path``
+        errors. Store the value when checking several paths, so the errors
+        are scanned once.
+        """
+        return frozenset(
+            error["required_path"]
+            for error in self.errors
+            if error.get("type") == "missing_required_path" and "required_path" in error
+        )
+
+    @property
+    def missing_operations(self) -> Mapping[str, frozenset[str]]:
+        """Get the required HTTP methods reported as missing, keyed by path.
+
+        Read from the ``required_path`` and ``method`` keys of
+        ``missing_required_operation`` errors. Each call builds a new
+        read-only mapping.
+        """
+        operations: dict[str, set[str]] = {}
+        for error in self.errors:
+            if (
+                error.get("type") == "missing_required_operation"
+                and "required_path" in error
+                and "method" in error
+            ):
+                operations.setdefault(error["required_path"], set()).add(
+                    error["method"]
+                )
+        return MappingProxyType(
+            {path: frozenset(methods) for path, methods in operations.items()}
+        )
+
     @property
     def has_critical_errors(self) -> bool:
         """Check if there are any critical errors."""
@@ -252,3 +345,15 @@ class ValidationResult(BaseModel):
             "info": len(self.info_errors),
             "total": len(self.errors),
         }
+
+
+# Shared result returned by ValidationResult.success() when no extra data is given
+_SUCCESS = ValidationResult(is_valid=True)
+
+
+@lru_cache(maxsize=256)
+def _keyed_success(validated_against: SpecificationKey) -> ValidationResult:
+    """Return the shared successful result for a specification key."""
+    return ValidationResult.model_construct(
+        is_valid=True, errors=(), warnings=(), validated_against=validated_against
+    )
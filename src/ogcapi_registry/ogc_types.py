@@ -1,10 +1,18 @@
 """OGC API types and conformance class definitions."""
 
 import re
+import sys
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+@lru_cache(maxsize=1024)
+def _lower_uri(uri: str) -> str:
+    """Lowercase and intern a conformance URI, once per distinct URI."""
+    return sys.intern(uri.lower())
 
 
 class OGCAPIType(str, Enum):
@@ -117,6 +125,94 @@ class OGCSpecificationKey(BaseModel):
         )
 
 
+# Regex pattern to parse OGC API conformance URIs
+# Matches: ogcapi-{type}-{part}/{version}/conf/{class}
+_URI_PATTERN = re.compile(
+    r"ogcapi-(\w+)-(\d+)/(\d+\.\d+(?:\.\d+)?)/conf/(\w+[-\w]*)",
+    re.IGNORECASE,
+)
+
+
+class _ParsedURI(NamedTuple):
+    """Values derived from a conformance class URI."""
+
+    api_type: OGCAPIType | None
+    part: int | None
+    spec_version: str | None
+    conformance_class_name: str | None
+    specification_key: OGCSpecificationKey | None
+
+
+def _detect_api_type(uri_lower: str) -> OGCAPIType | None:
+    """Determine the OGC API type from a lowercased conformance URI."""
+    # Check for specific API types in order of specificity
+    if "ogcapi-features" in uri_lower or "/features-" in uri_lower:
+        return OGCAPIType.FEATURES
+    elif "ogcapi-tiles" in uri_lower or "/tiles-" in uri_lower:
+        return OGCAPIType.TILES
+    elif "ogcapi-maps" in uri_lower or "/maps-" in uri_lower:
+        return OGCAPIType.MAPS
+    elif "ogcapi-processes" in uri_lower or "/processes-" in uri_lower:
+        return OGCAPIType.PROCESSES
+    elif "ogcapi-records" in uri_lower or "/records-" in uri_lower:
+        return OGCAPIType.RECORDS
+    elif "ogcapi-coverages" in uri_lower or "/coverages-" in uri_lower:
+        return OGCAPIType.COVERAGES
+    elif "ogcapi-edr" in uri_lower or "/edr-" in uri_lower:
+        return OGCAPIType.EDR
+    elif "ogcapi-styles" in uri_lower or "/styles-" in uri_lower:
+        return OGCAPIType.STYLES
+    elif "ogcapi-routes" in uri_lower or "/routes-" in uri_lower:
+        return OGCAPIType.ROUTES
+    elif "ogcapi-common" in uri_lower or "/common-" in uri_lower:
+        return OGCAPIType.COMMON
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_uri(uri: str) -> _ParsedURI:
+    """Derive the ConformanceClass properties from a URI, once per URI.
+
+    The values are memoized by URI rather than on the instance, so copies
+    made with ``model_copy(update=...)`` never see stale values.
+
+    Args:
+        uri: The conformance class URI
+
+    Returns:
+        The parsed values
+    """
+    api_type = _detect_api_type(_lower_uri(uri))
+    match = _URI_PATTERN.search(uri)
+
+    part: int | None = None
+    spec_version: str | None = None
+    name: str | None = None
+    if match:
+        part = int(match.group(2))
+        spec_version = match.group(3)
+        name = match.group(4)
+    else:
+        # Fallback: try simpler patterns
+        part_match = re.search(r"ogcapi-\w+-(\d+)/", uri, re.IGNORECASE)
+        if part_match:
+            part = int(part_match.group(1))
+        version_match = re.search(r"/(\d+\.\d+(?:\.\d+)?)/", uri)
+        if version_match:
+            spec_version = version_match.group(1)
+        name_match = re.search(r"/conf/([^/]+)/?$", uri, re.IGNORECASE)
+        if name_match:
+            name = name_match.group(1)
+
+    key = None
+    if api_type is not None and spec_version is not None:
+        key = OGCSpecificationKey(
+            api_type=api_type, spec_version=spec_version, part=part
+        )
+    return _ParsedURI(api_type, part, spec_version, name, key)
+
+
 class ConformanceClass(BaseModel):
     """Represents an OGC API conformance class.
 
@@ -134,41 +230,25 @@ class ConformanceClass(BaseModel):
 
     uri: str = Field(..., description="The conformance class URI")
 
-    # Regex pattern to parse OGC API conformance URIs
-    # Matches: ogcapi-{type}-{part}/{version}/conf/{class}
-    _URI_PATTERN = re.compile(
-        r"ogcapi-(\w+)-(\d+)/(\d+\.\d+(?:\.\d+)?)/conf/(\w+[-\w]*)",
-        re.IGNORECASE,
-    )
+    @field_validator("uri")
+    @classmethod
+    def _intern_uri(cls, value: str) -> str:
+        """Intern the URI so repeated conformance classes share one string."""
+        return sys.intern(value)
+
+    @property
+    def uri_lower(self) -> str:
+        """The lowercased URI, computed once per URI for case-insensitive matching.
+
+        The value is memoized by URI rather than on the instance, so copies
+        made with ``model_copy(update=...)`` never see a stale value.
+        """
+        return _lower_uri(self.uri)
 
     @property
     def api_type(self) -> OGCAPIType | None:
         """Determine the OGC API type from the conformance class URI."""
-        uri_lower = self.uri.lower()
-
-        # Check for specific API types in order of specificity
-        if "ogcapi-features" in uri_lower or "/features-" in uri_lower:
-            return OGCAPIType.FEATURES
-        elif "ogcapi-tiles" in uri_lower or "/tiles-" in uri_lower:
-            return OGCAPIType.TILES
-        elif "ogcapi-maps" in uri_lower or "/maps-" in uri_lower:
-            return OGCAPIType.MAPS
-        elif "ogcapi-processes" in uri_lower or "/processes-" in uri_lower:
-            return OGCAPIType.PROCESSES
-        elif "ogcapi-records" in uri_lower or "/records-" in uri_lower:
-            return OGCAPIType.RECORDS
-        elif "ogcapi-coverages" in uri_lower or "/coverages-" in uri_lower:
-            return OGCAPIType.COVERAGES
-        elif "ogcapi-edr" in uri_lower or "/edr-" in uri_lower:
-            return OGCAPIType.EDR
-        elif "ogcapi-styles" in uri_lower or "/styles-" in uri_lower:
-            return OGCAPIType.STYLES
-        elif "ogcapi-routes" in uri_lower or "/routes-" in uri_lower:
-            return OGCAPIType.ROUTES
-        elif "ogcapi-common" in uri_lower or "/common-" in uri_lower:
-            return OGCAPIType.COMMON
-
-        return None
+        return _parse_uri(self.uri).api_type
 
     @property
     def part(self) -> int | None:
@@ -177,16 +257,7 @@ class ConformanceClass(BaseModel):
         Returns:
             Part number (e.g., 1 for ogcapi-features-1) or None
         """
-        match = self._URI_PATTERN.search(self.uri)
-        if match:
-            return int(match.group(2))
-
-        # Fallback: try simpler pattern
-        simple_match = re.search(r"ogcapi-\w+-(\d+)/", self.uri, re.IGNORECASE)
-        if simple_match:
-            return int(simple_match.group(1))
-
-        return None
+        return _parse_uri(self.uri).part
 
     @property
     def spec_version(self) -> str | None:
@@ -195,16 +266,7 @@ class ConformanceClass(BaseModel):
         Returns:
             Version string (e.g., "1.0", "1.1") or None
         """
-        match = self._URI_PATTERN.search(self.uri)
-        if match:
-            return match.group(3)
-
-        # Fallback: try simpler pattern
-        simple_match = re.search(r"/(\d+\.\d+(?:\.\d+)?)/", self.uri)
-        if simple_match:
-            return simple_match.group(1)
-
-        return None
+        return _parse_uri(self.uri).spec_version
 
     @property
     def version(self) -> str | None:
@@ -221,21 +283,12 @@ class ConformanceClass(BaseModel):
         Returns:
             Conformance class name or None
         """
-        match = self._URI_PATTERN.search(self.uri)
-        if match:
-            return match.group(4)
-
-        # Fallback: try to get from /conf/{name}
-        simple_match = re.search(r"/conf/([^/]+)/?$", self.uri, re.IGNORECASE)
-        if simple_match:
-            return simple_match.group(1)
-
-        return None
+        return _parse_uri(self.uri).conformance_class_name
 
     @property
     def is_core(self) -> bool:
         """Check if this is a core conformance class."""
-        return "/conf/core" in self.uri.lower()
+        return "/conf/core" in self.uri_lower
 
     @property
     def specification_key(self) -> "OGCSpecificationKey | None":
@@ -244,7 +297,7 @@ class ConformanceClass(BaseModel):
         Returns:
             OGCSpecificationKey or None if cannot be determined
         """
-        return OGCSpecificationKey.from_conformance_class(self)
+        return _parse_uri(self.uri).specification_key
 
     def __hash__(self) -> int:
         return hash(self.uri)
@@ -16,6 +16,7 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Collection, Mapping
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
 
 if TYPE_CHECKING:
@@ -29,6 +30,59 @@ V_co = TypeVar(
 )  # Value type (covariant - only in return positions)
 T = TypeVar("T", covariant=True)  # Covariant type for returns
 
+# Precomputed member sets for the runtime-checkable protocols below. They are
+# kept at module level because any name in a Protocol body becomes a member.
+_VALIDATION_STRATEGY_MEMBERS = frozenset(
+    {
+        "api_type",
+        "validate",
+        "get_required_paths",
+        "get_required_operations",
+        "matches_conformance",
+        "get_conformance_score",
+        "supports_version",
+    }
+)
+_VERSION_AWARE_STRATEGY_MEMBERS = _VALIDATION_STRATEGY_MEMBERS | {
+    "get_spec_version_from_conformance",
+    "get_specification_key",
+}
+_OPENAPI_CLIENT_MEMBERS = frozenset({"fetch", "fetch_and_validate_structure"})
+_CONFORMANCE_CLASS_MEMBERS = frozenset({"uri", "api_type", "is_core"})
+_SPECIFICATION_KEY_MEMBERS = frozenset({"__hash__", "__eq__"})
+
+
+def _defines_members(other: type, members: frozenset[str]) -> bool:
+    """Check whether a class defines all members somewhere in its MRO.
+
+    A member set to None blocks the lookup, as with ``__hash__ = None``.
+    """
+    missing = set(members)
+    for base in other.__mro__:
+        namespace = base.__dict__
+        found = missing & namespace.keys()
+        if any(namespace[name] is None for name in found):
+            return False
+        missing -= found
+        if not missing:
+            return True
+    return False
+
+
+def _members_subclasshook(cls: type, other: type, members: frozenset[str]) -> bool:
+    """Implement a protocol ``__subclasshook__`` over a precomputed member set.
+
+    Replaces the default protocol hook, which recomputes the protocol
+    members and probes them one by one on every check. Positive results
+    are then cached per class by ``ABCMeta``; negative ones fall back to
+    the default instance attribute lookup.
+    """
+    if not cls.__dict__.get("_is_protocol", False):
+        return NotImplemented
+    if _defines_members(other, members):
+        return True
+    return NotImplemented
+
 
 @runtime_checkable
 class ValidationStrategyProtocol(Protocol):
@@ -63,6 +117,10 @@ class ValidationStrategyProtocol(Protocol):
         # CustomStrategy can be used anywhere ValidationStrategyProtocol is expected
     """
 
+    @classmethod
+    def __subclasshook__(cls, other: type) -> bool:
+        return _members_subclasshook(cls, other, _VALIDATION_STRATEGY_MEMBERS)
+
     @property
     def api_type(self) -> "OGCAPIType":
         """The OGC API type this strategy handles."""
@@ -86,7 +144,7 @@ class ValidationStrategyProtocol(Protocol):
     def get_required_operations(
         self,
         conformance_classes: list["ConformanceClass"],
-    ) -> dict[str, list[str]]:
+    ) -> Mapping[str, Collection[str]]:
         """Get required HTTP operations for each path."""
         ...
 
@@ -117,6 +175,10 @@ class VersionAwareStrategyProtocol(ValidationStrategyProtocol, Protocol):
     specification information from conformance classes.
     """
 
+    @classmethod
+    def __subclasshook__(cls, other: type) -> bool:
+        return _members_subclasshook(cls, other, _VERSION_AWARE_STRATEGY_MEMBERS)
+
     def supports_version(self, spec_version: str) -> bool:
         """Check if this strategy supports a specific specification version."""
         ...
@@ -219,6 +281,10 @@ class OpenAPIClientProtocol(Protocol):
         # CachedClient can be used anywhere OpenAPIClientProtocol is expected
     """
 
+    @classmethod
+    def __subclasshook__(cls, other: type) -> bool:
+        return _members_subclasshook(cls, other, _OPENAPI_CLIENT_MEMBERS)
+
     def fetch(
         self,
         url: str,
@@ -258,6 +324,10 @@ class AsyncOpenAPIClientProtocol(Protocol):
     Async version of OpenAPIClientProtocol for use with asyncio.
     """
 
+    @classmethod
+    def __subclasshook__(cls, other: type) -> bool:
+        return _members_subclasshook(cls, other, _OPENAPI_CLIENT_MEMBERS)
+
     async def fetch(
         self,
         url: str,
@@ -280,6 +350,10 @@ class ConformanceClassProtocol(Protocol):
     Enables duck typing for any object that represents an OGC conformance class.
     """
 
+    @classmethod
+    def __subclasshook__(cls, other: type) -> bool:
+        return _members_subclasshook(cls, other, _CONFORMANCE_CLASS_MEMBERS)
+
     @property
     def uri(self) -> str:
         """The conformance class URI."""
@@ -303,6 +377,10 @@ class SpecificationKeyProtocol(Protocol):
     Enables duck typing for any object that can serve as a specification key.
     """
 
+    @classmethod
+    def __subclasshook__(cls, other: type) -> bool:
+        return _members_subclasshook(cls, other, _SPECIFICATION_KEY_MEMBERS)
+
     def __hash__(self) -> int:
         """Keys must be hashable for use in dicts/sets."""
         ...
@@ -1,7 +1,7 @@
 """In-memory registry for OpenAPI specifications."""
 
 import threading
-from typing import Iterator
+from collections.abc import Iterable, Iterator
 
 from .client import AsyncOpenAPIClient, OpenAPIClient
 from .exceptions import (
@@ -13,7 +13,19 @@ from .models import (
     SpecificationKey,
     SpecificationMetadata,
     SpecificationType,
+    _spec_key,
 )
+from .protocols import AsyncOpenAPIClientProtocol, OpenAPIClientProtocol
+
+
+class _SpecificationDict(dict[SpecificationKey, RegisteredSpecification]):
+    """Specification storage that raises SpecificationNotFoundError on a miss.
+
+    Indexing a missing key raises directly, so lookups need a single probe.
+    """
+
+    def __missing__(self, key: SpecificationKey) -> RegisteredSpecification:
+        raise SpecificationNotFoundError(key.spec_type.value, key.version)
 
 
 class SpecificationRegistry:
@@ -24,11 +36,18 @@ class SpecificationRegistry:
     from remote URLs.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty registry."""
-        self._specifications: dict[SpecificationKey, RegisteredSpecification] = {}
+    def __init__(self, client: OpenAPIClientProtocol | None = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            client: Optional client used by register_from_url. If not
+                provided, a default OpenAPIClient is created.
+        """
+        self._specifications = _SpecificationDict()
+        # Highest registered version key per specification type
+        self._latest: dict[SpecificationType, SpecificationKey] = {}
         self._lock = threading.RLock()
-        self._client = OpenAPIClient()
+        self._client = client or OpenAPIClient()
 
     def register(
         self,
@@ -65,12 +84,61 @@ class SpecificationRegistry:
         )
 
         with self._lock:
-            if key in self._specifications and not overwrite:
+            if not overwrite and key in self._specifications:
                 raise SpecificationAlreadyExistsError(spec_type.value, version)
             self._specifications[key] = spec
+            self._index_latest(key)
 
         return spec
 
+    def register_many(
+        self,
+        items: Iterable[tuple[dict, SpecificationType, str]],
+        overwrite: bool = False,
+    ) -> list[RegisteredSpecification]:
+        """Register several OpenAPI specifications in one operation.
+
+        Duplicates are detected with a single key-set intersection and the
+        batch is inserted with one dict update. The operation is atomic:
+        if any specification already exists and overwrite=False, nothing
+        is registered.
+
+        Args:
+            items: Tuples of (content, spec_type, version)
+            overwrite: If True, overwrite existing specifications
+
+        Returns:
+            The registered specifications
+
+        Raises:
+            SpecificationAlreadyExistsError: If a specification exists (in the
+                registry or earlier in the batch) and overwrite=False
+        """
+        specs: dict[SpecificationKey, RegisteredSpecification] = {}
+        for content, spec_type, version in items:
+            key = SpecificationKey(spec_type=spec_type, version=version)
+            if key in specs and not overwrite:
+                raise SpecificationAlreadyExistsError(spec_type.value, version)
+            specs[key] = RegisteredSpecification(
+                key=key,
+                metadata=SpecificationMetadata(),
+                raw_content=content,
+            )
+
+        with self._lock:
+            if not overwrite:
+                duplicates = specs.keys() & self._specifications.keys()
+                if duplicates:
+                    key = next(k for k in specs if k in duplicates)
+                    raise SpecificationAlreadyExistsError(
+                        key.spec_type.value, key.version
+                    )
+            self._specifications.update(specs)
+            for key in specs:
+                self._index_latest(key)
+
+        return list(specs.values())
+
     def register_from_url(
         self,
         url: str,
@@ -98,7 +166,38 @@ class SpecificationRegistry:
             SpecificationAlreadyExistsError: If specification exists and overwrite=False
         """
         content, metadata = self._client.fetch_and_validate_structure(url)
+        return self.register_fetched(
+            content, metadata, spec_type, version, overwrite=overwrite
+        )
 
+    def register_fetched(
+        self,
+        content: dict,
+        metadata: SpecificationMetadata,
+        spec_type: SpecificationType | None = None,
+        version: str | None = None,
+        overwrite: bool = False,
+    ) -> RegisteredSpecification:
+        """Register an already fetched specification.
+
+        This is the registration step of register_from_url, for content
+        fetched elsewhere (e.g. several URLs fetched concurrently). If
+        spec_type or version are not provided, they are inferred from the
+        content's 'openapi' field.
+
+        Args:
+            content: Structurally checked specification content
+            metadata: Metadata returned by the fetch
+            spec_type: Optional specification type (inferred if not provided)
+            version: Optional version string (inferred if not provided)
+            overwrite: If True, overwrite existing specification
+
+        Returns:
+            The registered specification
+
+        Raises:
+            SpecificationAlreadyExistsError: If specification exists and overwrite=False
+        """
         # Infer type and version from content if not provided
         openapi_version = content["openapi"]
         if spec_type is None:
@@ -129,10 +228,8 @@ class SpecificationRegistry:
         Raises:
             SpecificationNotFoundError: If the specification is not found
         """
-        key = SpecificationKey(spec_type=spec_type, version=version)
+        key = _spec_key(spec_type, version)
         with self._lock:
-            if key not in self._specifications:
-                raise SpecificationNotFoundError(spec_type.value, version)
             return self._specifications[key]
 
     def get_by_key(self, key: SpecificationKey) -> RegisteredSpecification:
@@ -148,8 +245,27 @@ class SpecificationRegistry:
             SpecificationNotFoundError: If the specification is not found
         """
         with self._lock:
-            if key not in self._specifications:
-                raise SpecificationNotFoundError(key.spec_type.value, key.version)
+            return self._specifications[key]
+
+    def get_latest(self, spec_type: SpecificationType) -> RegisteredSpecification:
+        """Get the highest registered version of a specification type.
+
+        Versions are compared as strings. The latest key per type is kept
+        up to date on registration and removal, so this is a dict lookup.
+
+        Args:
+            spec_type: Type of the specification
+
+        Returns:
+            The latest registered specification of that type
+
+        Raises:
+            SpecificationNotFoundError: If no specification of this type exists
+        """
+        with self._lock:
+            key = self._latest.get(spec_type)
+            if key is None:
+                raise SpecificationNotFoundError(spec_type.value, "any")
             return self._specifications[key]
 
     def exists(self, spec_type: SpecificationType, version: str) -> bool:
@@ -162,7 +278,7 @@ class SpecificationRegistry:
         Returns:
             True if the specification exists, False otherwise
         """
-        key = SpecificationKey(spec_type=spec_type, version=version)
+        key = _spec_key(spec_type, version)
         with self._lock:
             return key in self._specifications
 
@@ -176,10 +292,12 @@ class SpecificationRegistry:
         Returns:
             True if the specification was removed, False if it didn't exist
         """
-        key = SpecificationKey(spec_type=spec_type, version=version)
+        key = _spec_key(spec_type, version)
         with self._lock:
             if key in self._specifications:
                 del self._specifications[key]
+                if self._latest.get(spec_type) == key:
+                    self._reindex_latest(spec_type)
                 return True
             return False
 
@@ -187,6 +305,7 @@ class SpecificationRegistry:
         """Remove all specifications from the registry."""
         with self._lock:
             self._specifications.clear()
+            self._latest.clear()
 
     def list_keys(self) -> list[SpecificationKey]:
         """List all specification keys in the registry.
@@ -206,6 +325,20 @@ class SpecificationRegistry:
         with self._lock:
             return list(self._specifications.values())
 
+    def _index_latest(self, key: SpecificationKey) -> None:
+        """Record key as the latest of its type if it has a higher version."""
+        current = self._latest.get(key.spec_type)
+        if current is None or key.version > current.version:
+            self._latest[key.spec_type] = key
+
+    def _reindex_latest(self, spec_type: SpecificationType) -> None:
+        """Recompute the latest key of a type after its latest was removed."""
+        keys = [key for key in self._specifications if key.spec_type == spec_type]
+        if keys:
+            self._latest[spec_type] = max(keys, key=lambda key: key.version)
+        else:
+            self._latest.pop(spec_type, None)
+
     def __len__(self) -> int:
         """Return the number of specifications in the registry."""
         with self._lock:
@@ -230,10 +363,15 @@ class AsyncSpecificationRegistry:
     while maintaining a synchronous internal store.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty registry."""
+    def __init__(self, client: AsyncOpenAPIClientProtocol | None = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            client: Optional async client used by register_from_url. If not
+                provided, a default AsyncOpenAPIClient is created.
+        """
         self._sync_registry = SpecificationRegistry()
-        self._async_client = AsyncOpenAPIClient()
+        self._async_client = client or AsyncOpenAPIClient()
 
     def register(
         self,
@@ -265,6 +403,17 @@ class AsyncSpecificationRegistry:
             overwrite=overwrite,
         )
 
+    def register_many(
+        self,
+        items: Iterable[tuple[dict, SpecificationType, str]],
+        overwrite: bool = False,
+    ) -> list[RegisteredSpecification]:
+        """Register several OpenAPI specifications in one operation.
+
+        This method is synchronous as it doesn't involve I/O.
+        """
+        return self._sync_registry.register_many(items, overwrite=overwrite)
+
     async def register_from_url(
         self,
         url: str,
@@ -287,20 +436,24 @@ class AsyncSpecificationRegistry:
             content,
             metadata,
         ) = await self._async_client.fetch_and_validate_structure(url)
+        return self.register_fetched(
+            content, metadata, spec_type, version, overwrite=overwrite
+        )
 
-        # Infer type and version from content if not provided
-        openapi_version = content["openapi"]
-        if spec_type is None:
-            spec_type = SpecificationType.from_version(openapi_version)
-        if version is None:
-            version = openapi_version
+    def register_fetched(
+        self,
+        content: dict,
+        metadata: SpecificationMetadata,
+        spec_type: SpecificationType | None = None,
+        version: str | None = None,
+        overwrite: bool = False,
+    ) -> RegisteredSpecification:
+        """Register an already fetched specification.
 
-        return self.register(
-            content=content,
-            spec_type=spec_type,
-            version=version,
-            metadata=metadata,
-            overwrite=overwrite,
+        This method is synchronous as it doesn't involve I/O.
+        """
+        return self._sync_registry.register_fetched(
+            content, metadata, spec_type, version, overwrite=overwrite
         )
 
     def get(
@@ -313,6 +466,10 @@ class AsyncSpecificationRegistry:
         """Get a specification from the registry by key."""
         return self._sync_registry.get_by_key(key)
 
+    def get_latest(self, spec_type: SpecificationType) -> RegisteredSpecification:
+        """Get the highest registered version of a specification type."""
+        return self._sync_registry.get_latest(spec_type)
+
     def exists(self, spec_type: SpecificationType, version: str) -> bool:
         """Check if a specification exists in the registry."""
         return self._sync_registry.exists(spec_type, version)
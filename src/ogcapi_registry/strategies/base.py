@@ -1,11 +1,289 @@
 """Base classes and protocols for validation strategies."""
 
+import re
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar
+from collections.abc import Callable, Collection, Iterable, Mapping
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, ClassVar, TypeVar
+from weakref import WeakKeyDictionary
 
 from ..models import ErrorSeverity, ValidationResult
 from ..ogc_types import ConformanceClass, OGCAPIType, OGCSpecificationKey
 
+# Shared read-only fallback for documents without a "paths" object, so that
+# validators don't allocate a fresh empty dict on every lookup.
+EMPTY_PATHS: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a path pattern with {placeholder} segments into a regex.
+
+    Args:
+        pattern: Pattern with {placeholder} syntax
+
+    Returns:
+        Compiled regex anchored to the full path
+    """
+    # Replace {anything} with a regex that matches path segments
+    regex_pattern = re.sub(r"\{[^}]+\}", r"[^/]+", pattern)
+    return re.compile(f"^{regex_pattern}$")
+
+
+def _slash_count(pattern: str) -> int:
+    """Count the separators a path must have to match a placeholder pattern.
+
+    Placeholders never match "/", so a path can only match a pattern with
+    the same number of separators; comparing counts is a cheap pre-filter
+    before running the regex.
+
+    Args:
+        pattern: Pattern with {placeholder} syntax
+
+    Returns:
+        Number of "/" characters outside placeholders
+    """
+    return re.sub(r"\{[^}]+\}", "", pattern).count("/")
+
+
+@lru_cache(maxsize=256)
+def _compile_paths_check(
+    required_paths: tuple[str, ...],
+) -> Callable[[Mapping[str, Any]], list[tuple[str, bool]]]:
+    """Build a checker that reports which required paths a document lacks.
+
+    Patterns are compiled once per distinct set of required paths; the
+    returned closure only walks the document paths.
+
+    Args:
+        required_paths: Required paths, possibly with {placeholder} segments
+
+    Returns:
+        Function mapping document paths to (required_path, is_pattern) pairs
+        for every required path that is missing
+    """
+    checks = tuple(
+        (
+            required_path,
+            _compile_pattern(required_path) if "{" in required_path else None,
+        )
+        for required_path in required_paths
+    )
+
+    # Literal paths are checked with one set difference against the
+    # document keys; only placeholder patterns need regex matching
+    literal_paths = frozenset(
+        required_path for required_path, regex in checks if regex is None
+    )
+    matchers = tuple(
+        (1 << index, _slash_count(required_path), regex.match)
+        for index, (required_path, regex) in enumerate(checks)
+        if regex is not None
+    )
+    # Bit i is set once the placeholder pattern at index i has matched
+    full_mask = 0
+    for bit, _, _ in matchers:
+        full_mask |= bit
+
+    def check(paths: Mapping[str, Any]) -> list[tuple[str, bool]]:
+        absent = literal_paths - paths.keys()
+
+        # Resolve every placeholder pattern in a single walk of the paths,
+        # stopping as soon as all of them have matched
+        covered = 0
+        if full_mask:
+            for path in paths:
+                slashes = path.count("/")
+                for bit, pattern_slashes, match in matchers:
+                    if slashes == pattern_slashes and not covered & bit and match(path):
+                        covered |= bit
+                if covered == full_mask:
+                    break
+
+        if not absent and covered == full_mask:
+            return []
+
+        missing: list[tuple[str, bool]] = []
+        for index, (required_path, regex) in enumerate(checks):
+            if regex is None:
+                if required_path in absent:
+                    missing.append((required_path, False))
+            elif not covered & (1 << index):
+                missing.append((required_path, True))
+        return missing
+
+    return check
+
+
+@lru_cache(maxsize=256)
+def _compile_operations_check(
+    required_operations: tuple[tuple[str, tuple[str, ...]], ...],
+) -> Callable[[Mapping[str, Any]], list[tuple[str, str]]]:
+    """Build a checker that reports required operations a document lacks.
+
+    Args:
+        required_operations: Pairs of path pattern and required HTTP methods
+
+    Returns:
+        Function mapping document paths to (path, method) pairs for every
+        matching path that is missing a required method
+    """
+    checks = tuple(
+        (
+            pattern,
+            _compile_pattern(pattern) if "{" in pattern else None,
+            tuple((method, method.lower()) for method in methods),
+        )
+        for pattern, methods in required_operations
+    )
+
+    matchers = tuple(
+        (index, _slash_count(pattern), regex.match)
+        for index, (pattern, regex, _) in enumerate(checks)
+        if regex is not None
+    )
+
+    def check(paths: Mapping[str, Any]) -> list[tuple[str, str]]:
+        # Collect the paths matching each placeholder pattern in one walk
+        matched: dict[int, list[str]] = {index: [] for index, _, _ in matchers}
+        if matchers:
+            for path in paths:
+                slashes = path.count("/")
+                for index, pattern_slashes, match in matchers:
+                    if slashes == pattern_slashes and match(path):
+                        matched[index].append(path)
+
+        missing: list[tuple[str, str]] = []
+        for index, (pattern, regex, methods) in enumerate(checks):
+            if regex is None:
+                matching_paths: Iterable[str] = (pattern,) if pattern in paths else ()
+            else:
+                matching_paths = matched[index]
+            for path in matching_paths:
+                path_item = paths[path]
+                for method, method_lower in methods:
+                    if method_lower not in path_item:
+                        missing.append((path, method))
+        return missing
+
+    return check
+
+
+RequiredPathsMethod = Callable[[Any, list[ConformanceClass]], list[str]]
+RequiredOperations = Mapping[str, frozenset[str]]
+OperationsBuilder = Callable[
+    [Any, list[ConformanceClass]], Mapping[str, Collection[str]]
+]
+RequiredOperationsMethod = Callable[[Any, list[ConformanceClass]], RequiredOperations]
+_Built = TypeVar("_Built")
+_Frozen = TypeVar("_Frozen")
+
+# Distinct conformance class lists remembered per strategy before the cache
+# of a decorated method is cleared
+_REQUIREMENTS_CACHE_SIZE = 256
+
+
+def _freeze_operations(operations: Mapping[str, Collection[str]]) -> RequiredOperations:
+    """Return a read-only copy of an operations map with frozenset methods."""
+    return MappingProxyType(
+        {path: frozenset(methods) for path, methods in operations.items()}
+    )
+
+
+def _memoize_per_strategy(
+    method: Callable[[Any, list[ConformanceClass]], _Built],
+    freeze: Callable[[_Built], _Frozen],
+) -> Callable[[Any, list[ConformanceClass]], _Frozen]:
+    """Memoize a strategy method per instance and conformance classes.
+
+    Each strategy gets its own cache, held in a WeakKeyDictionary so that
+    caching never keeps a strategy alive. Calls whose strategy or
+    conformance classes can't be hashed are not cached.
+
+    Args:
+        method: The method to wrap
+        freeze: Converts a computed value into the immutable form to cache
+
+    Returns:
+        A function returning the frozen, possibly cached, value
+    """
+    results: WeakKeyDictionary[Any, dict[tuple[ConformanceClass, ...], _Frozen]] = (
+        WeakKeyDictionary()
+    )
+
+    def lookup(self: Any, conformance_classes: list[ConformanceClass]) -> _Frozen:
+        key = tuple(conformance_classes)
+        try:
+            cache = results.setdefault(self, {})
+            value = cache.get(key)
+        except TypeError:  # unhashable strategy or duck-typed conformance classes
+            return freeze(method(self, conformance_classes))
+        if value is None:
+            value = freeze(method(self, list(key)))
+            if len(cache) >= _REQUIREMENTS_CACHE_SIZE:
+                cache.clear()
+            cache[key] = value
+        return value
+
+    return lookup
+
+
+def cached_required_paths(method: RequiredPathsMethod) -> RequiredPathsMethod:
+    """Memoize a get_required_paths method per strategy and conformance classes.
+
+    Results are cached as tuples and a new list is returned on every call,
+    so callers may still modify the value they receive.
+
+    Args:
+        method: The get_required_paths implementation to wrap
+
+    Returns:
+        The memoizing wrapper
+    """
+    lookup = _memoize_per_strategy(method, tuple)
+
+    @wraps(method)
+    def wrapper(self: Any, conformance_classes: list[ConformanceClass]) -> list[str]:
+        return list(lookup(self, conformance_classes))
+
+    return wrapper
+
+
+def cached_required_operations(
+    method: OperationsBuilder,
+) -> RequiredOperationsMethod:
+    """Memoize a get_required_operations method per strategy and conformance.
+
+    Results are frozen into a read-only mapping of frozensets, so the same
+    object is shared by every caller without defensive copies.
+
+    Args:
+        method: The get_required_operations implementation to wrap
+
+    Returns:
+        The memoizing wrapper
+    """
+    return wraps(method)(_memoize_per_strategy(method, _freeze_operations))
+
+
+@lru_cache(maxsize=256)
+def _compile_substrings(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile substring patterns into one regex matching any of them.
+
+    Memoized by the patterns themselves, so a strategy whose patterns change
+    after class creation is still matched against its current patterns.
+
+    Args:
+        patterns: Substrings to look for, matched case-insensitively
+
+    Returns:
+        Compiled alternation of the lowercased patterns, or None if empty
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(pattern.lower()) for pattern in patterns))
+
 
 class ValidationStrategy(ABC):
     """Abstract base class for OGC API validation strategies.
@@ -15,6 +293,9 @@ class ValidationStrategy(ABC):
     in the OpenAPI document.
     """
 
+    # Weak references let the requirement caches hold strategies weakly
+    __slots__ = ("__weakref__",)
+
     # Class-level attributes to be overridden by subclasses
     api_type: ClassVar[OGCAPIType]
     required_conformance_patterns: ClassVar[list[str]] = []
@@ -61,15 +342,15 @@ class ValidationStrategy(ABC):
     def get_required_operations(
         self,
         conformance_classes: list[ConformanceClass],
-    ) -> dict[str, list[str]]:
+    ) -> RequiredOperations:
         """Get required operations for each path.
 
         Args:
             conformance_classes: Conformance classes declared by the implementation
 
         Returns:
-            Dict mapping path patterns to required HTTP methods
-            e.g., {"/collections": ["get"], "/collections/{collectionId}": ["get"]}
+            Read-only mapping of path patterns to required HTTP methods
+            e.g., {"/collections": frozenset({"get"})}
         """
         ...
 
@@ -88,19 +369,12 @@ class ValidationStrategy(ABC):
         Returns:
             True if this strategy should handle these conformance classes
         """
-        if not self.required_conformance_patterns:
+        required_re = _compile_substrings(tuple(self.required_conformance_patterns))
+        if required_re is None:
             return False
 
-        cc_uris = {cc.uri.lower() for cc in conformance_classes}
-
-        for pattern in self.required_conformance_patterns:
-            pattern_lower = pattern.lower()
-            # Check for exact match or pattern contained in URI
-            for uri in cc_uris:
-                if pattern_lower in uri or uri == pattern_lower:
-                    return True
-
-        return False
+        # One search per URI covers every required pattern
+        return any(required_re.search(cc.uri_lower) for cc in conformance_classes)
 
     def get_conformance_score(
         self,
@@ -118,7 +392,7 @@ class ValidationStrategy(ABC):
             Integer score (higher = better match)
         """
         score = 0
-        cc_uris = {cc.uri.lower() for cc in conformance_classes}
+        cc_uris = {cc.uri_lower for cc in conformance_classes}
 
         for pattern in self.required_conformance_patterns:
             pattern_lower = pattern.lower()
@@ -243,83 +517,59 @@ class ValidationStrategy(ABC):
         Returns:
             List of error dicts for missing paths
         """
-        errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
-
-        for required_path in required_paths:
-            # Handle path parameters like {collectionId}
-            if "{" in required_path:
-                # Check if any path matches the pattern
-                pattern_found = False
-                for path in paths:
-                    if self._path_matches_pattern(path, required_path):
-                        pattern_found = True
-                        break
-                if not pattern_found:
-                    errors.append(
-                        self.create_error(
-                            path=f"paths/{required_path}",
-                            message=f"Required path pattern '{required_path}' not found",
-                            error_type="missing_required_path",
-                            severity=severity,
-                        )
-                    )
-            else:
-                if required_path not in paths:
-                    errors.append(
-                        self.create_error(
-                            path=f"paths/{required_path}",
-                            message=f"Required path '{required_path}' not found",
-                            error_type="missing_required_path",
-                            severity=severity,
-                        )
-                    )
-
-        return errors
+        paths = document.get("paths") or EMPTY_PATHS
+        check = _compile_paths_check(tuple(required_paths))
+
+        return [
+            self.create_error(
+                path=f"paths/{required_path}",
+                message=(
+                    f"Required path pattern '{required_path}' not found"
+                    if is_pattern
+                    else f"Required path '{required_path}' not found"
+                ),
+                error_type="missing_required_path",
+                severity=severity,
+            )
+            | {"required_path": required_path}
+            for required_path, is_pattern in check(paths)
+        ]
 
     def validate_operations_exist(
         self,
         document: dict[str, Any],
-        required_operations: dict[str, list[str]],
+        required_operations: Mapping[str, Collection[str]],
         severity: ErrorSeverity = ErrorSeverity.CRITICAL,
     ) -> list[dict[str, Any]]:
         """Check that required operations exist for paths.
 
         Args:
             document: The OpenAPI document
-            required_operations: Dict mapping paths to required methods
+            required_operations: Mapping of paths to required methods
             severity: Severity level for errors (default: CRITICAL)
 
         Returns:
             List of error dicts for missing operations
         """
-        errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
-
-        for path_pattern, methods in required_operations.items():
-            # Find matching path(s)
-            matching_paths = []
-            for path in paths:
-                if self._path_matches_pattern(path, path_pattern):
-                    matching_paths.append(path)
-
-            if not matching_paths:
-                continue  # Path validation handles missing paths
-
-            for path in matching_paths:
-                path_item = paths.get(path, {})
-                for method in methods:
-                    if method.lower() not in path_item:
-                        errors.append(
-                            self.create_error(
-                                path=f"paths/{path}/{method}",
-                                message=f"Required operation '{method.upper()}' not found for path '{path}'",
-                                error_type="missing_required_operation",
-                                severity=severity,
-                            )
-                        )
-
-        return errors
+        paths = document.get("paths") or EMPTY_PATHS
+        # Paths with no match are skipped; path validation reports them
+        check = _compile_operations_check(
+            tuple(
+                (pattern, tuple(sorted(methods)))
+                for pattern, methods in required_operations.items()
+            )
+        )
+
+        return [
+            self.create_error(
+                path=f"paths/{path}/{method}",
+                message=f"Required operation '{method.upper()}' not found for path '{path}'",
+                error_type="missing_required_operation",
+                severity=severity,
+            )
+            | {"required_path": path, "method": method}
+            for path, method in check(paths)
+        ]
 
     @staticmethod
     def _path_matches_pattern(path: str, pattern: str) -> bool:
@@ -332,14 +582,7 @@ class ValidationStrategy(ABC):
         Returns:
             True if path matches the pattern
         """
-        import re
-
-        # Convert pattern to regex
-        # Replace {anything} with a regex that matches path segments
-        regex_pattern = re.sub(r"\{[^}]+\}", r"[^/]+", pattern)
-        regex_pattern = f"^{regex_pattern}$"
-
-        return bool(re.match(regex_pattern, path))
+        return _compile_pattern(pattern).match(path) is not None
 
 
 class CompositeValidationStrategy(ValidationStrategy):
@@ -349,6 +592,8 @@ class CompositeValidationStrategy(ValidationStrategy):
     OGC API types (e.g., Features + Tiles).
     """
 
+    __slots__ = ("_strategies",)
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.COMMON
 
     def __init__(self, strategies: list[ValidationStrategy]) -> None:
@@ -399,15 +644,19 @@ class CompositeValidationStrategy(ValidationStrategy):
         conformance_classes: list[ConformanceClass],
     ) -> list[str]:
         """Get combined required paths from all strategies."""
-        paths: set[str] = set()
-        for strategy in self._strategies:
-            paths.update(strategy.get_required_paths(conformance_classes))
-        return list(paths)
+        return list(
+            set().union(
+                *(
+                    strategy.get_required_paths(conformance_classes)
+                    for strategy in self._strategies
+                )
+            )
+        )
 
     def get_required_operations(
         self,
         conformance_classes: list[ConformanceClass],
-    ) -> dict[str, list[str]]:
+    ) -> RequiredOperations:
         """Get combined required operations from all strategies."""
         operations: dict[str, set[str]] = {}
         for strategy in self._strategies:
@@ -417,7 +666,7 @@ class CompositeValidationStrategy(ValidationStrategy):
                 if path not in operations:
                     operations[path] = set()
                 operations[path].update(methods)
-        return {path: list(methods) for path, methods in operations.items()}
+        return _freeze_operations(operations)
 
     def matches_conformance(
         self,
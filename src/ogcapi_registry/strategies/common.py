@@ -4,7 +4,12 @@ from typing import Any, ClassVar
 
 from ..models import ErrorSeverity, ValidationResult
 from ..ogc_types import ConformanceClass, OGCAPIType
-from .base import ValidationStrategy
+from .base import (
+    EMPTY_PATHS,
+    ValidationStrategy,
+    cached_required_operations,
+    cached_required_paths,
+)
 
 
 class CommonStrategy(ValidationStrategy):
@@ -14,6 +19,8 @@ class CommonStrategy(ValidationStrategy):
     shared by all OGC API implementations.
     """
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.COMMON
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-common",
@@ -65,6 +72,7 @@ class CommonStrategy(ValidationStrategy):
 
         return ValidationResult.success(warnings=tuple(warnings))
 
+    @cached_required_paths
     def get_required_paths(
         self,
         conformance_classes: list[ConformanceClass],
@@ -89,6 +97,7 @@ class CommonStrategy(ValidationStrategy):
 
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self,
         conformance_classes: list[ConformanceClass],
@@ -120,7 +129,7 @@ class CommonStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         landing_page = paths.get("/", {})
         get_op = landing_page.get("get", {})
@@ -154,7 +163,7 @@ class CommonStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         conformance = paths.get("/conformance", {})
         get_op = conformance.get("get", {})
@@ -191,4 +200,4 @@ class CommonStrategy(ValidationStrategy):
             True if a matching conformance class exists
         """
         pattern_lower = pattern.lower()
-        return any(pattern_lower in cc.uri.lower() for cc in conformance_classes)
+        return any(pattern_lower in cc.uri_lower for cc in conformance_classes)
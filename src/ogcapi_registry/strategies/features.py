@@ -4,7 +4,7 @@ from typing import Any, ClassVar
 
 from ..models import ErrorSeverity, ValidationResult
 from ..ogc_types import ConformanceClass, OGCAPIType
-from .base import ValidationStrategy
+from .base import EMPTY_PATHS, ValidationStrategy, cached_required_operations
 
 
 class FeaturesStrategy(ValidationStrategy):
@@ -14,6 +14,8 @@ class FeaturesStrategy(ValidationStrategy):
     specification, including Part 1 (Core), Part 2 (CRS), and Part 3 (Filtering).
     """
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.FEATURES
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-features",
@@ -98,6 +100,7 @@ class FeaturesStrategy(ValidationStrategy):
 
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self,
         conformance_classes: list[ConformanceClass],
@@ -133,7 +136,7 @@ class FeaturesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         collections = paths.get("/collections", {})
         get_op = collections.get("get", {})
@@ -170,7 +173,7 @@ class FeaturesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Find the items path
         items_path = None
@@ -231,7 +234,7 @@ class FeaturesStrategy(ValidationStrategy):
             List of validation errors (WARNING level - optional conformance class)
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Find items path
         for path, path_item in paths.items():
@@ -283,7 +286,7 @@ class FeaturesStrategy(ValidationStrategy):
             List of validation warnings (INFO level - filtering details are complex)
         """
         warnings: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Find items path
         for path, path_item in paths.items():
@@ -329,4 +332,4 @@ class FeaturesStrategy(ValidationStrategy):
     ) -> bool:
         """Check if a conformance class matching the pattern exists."""
         pattern_lower = pattern.lower()
-        return any(pattern_lower in cc.uri.lower() for cc in conformance_classes)
+        return any(pattern_lower in cc.uri_lower for cc in conformance_classes)
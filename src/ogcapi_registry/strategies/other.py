@@ -4,12 +4,19 @@ from typing import Any, ClassVar
 
 from ..models import ValidationResult
 from ..ogc_types import ConformanceClass, OGCAPIType
-from .base import ValidationStrategy
+from .base import (
+    EMPTY_PATHS,
+    ValidationStrategy,
+    cached_required_operations,
+    cached_required_paths,
+)
 
 
 class EDRStrategy(ValidationStrategy):
     """Validation strategy for OGC API - Environmental Data Retrieval."""
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.EDR
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-edr",
@@ -47,6 +54,7 @@ class EDRStrategy(ValidationStrategy):
             return ValidationResult.failure(errors, warnings=tuple(warnings))
         return ValidationResult.success(warnings=tuple(warnings))
 
+    @cached_required_paths
     def get_required_paths(
         self, conformance_classes: list[ConformanceClass]
     ) -> list[str]:
@@ -60,6 +68,7 @@ class EDRStrategy(ValidationStrategy):
 
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self, conformance_classes: list[ConformanceClass]
     ) -> dict[str, list[str]]:
@@ -82,7 +91,7 @@ class EDRStrategy(ValidationStrategy):
         conformance_classes: list[ConformanceClass],
     ) -> list[dict[str, Any]]:
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         query_types = ["position", "area", "cube", "trajectory", "corridor"]
         for query in query_types:
@@ -110,12 +119,14 @@ class EDRStrategy(ValidationStrategy):
         conformance_classes: list[ConformanceClass], pattern: str
     ) -> bool:
         pattern_lower = pattern.lower()
-        return any(pattern_lower in cc.uri.lower() for cc in conformance_classes)
+        return any(pattern_lower in cc.uri_lower for cc in conformance_classes)
 
 
 class CoveragesStrategy(ValidationStrategy):
     """Validation strategy for OGC API - Coverages."""
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.COVERAGES
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-coverages",
@@ -158,6 +169,7 @@ class CoveragesStrategy(ValidationStrategy):
         ]
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self, conformance_classes: list[ConformanceClass]
     ) -> dict[str, list[str]]:
@@ -173,6 +185,8 @@ class CoveragesStrategy(ValidationStrategy):
 class MapsStrategy(ValidationStrategy):
     """Validation strategy for OGC API - Maps."""
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.MAPS
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-maps",
@@ -215,6 +229,7 @@ class MapsStrategy(ValidationStrategy):
         ]
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self, conformance_classes: list[ConformanceClass]
     ) -> dict[str, list[str]]:
@@ -230,6 +245,8 @@ class MapsStrategy(ValidationStrategy):
 class StylesStrategy(ValidationStrategy):
     """Validation strategy for OGC API - Styles."""
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.STYLES
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-styles",
@@ -258,6 +275,7 @@ class StylesStrategy(ValidationStrategy):
             return ValidationResult.failure(errors, warnings=tuple(warnings))
         return ValidationResult.success(warnings=tuple(warnings))
 
+    @cached_required_paths
     def get_required_paths(
         self, conformance_classes: list[ConformanceClass]
     ) -> list[str]:
@@ -269,6 +287,7 @@ class StylesStrategy(ValidationStrategy):
 
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self, conformance_classes: list[ConformanceClass]
     ) -> dict[str, list[str]]:
@@ -290,12 +309,14 @@ class StylesStrategy(ValidationStrategy):
         conformance_classes: list[ConformanceClass], pattern: str
     ) -> bool:
         pattern_lower = pattern.lower()
-        return any(pattern_lower in cc.uri.lower() for cc in conformance_classes)
+        return any(pattern_lower in cc.uri_lower for cc in conformance_classes)
 
 
 class RoutesStrategy(ValidationStrategy):
     """Validation strategy for OGC API - Routes."""
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.ROUTES
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-routes",
@@ -326,6 +347,7 @@ class RoutesStrategy(ValidationStrategy):
     ) -> list[str]:
         return ["/", "/conformance", "/routes"]
 
+    @cached_required_operations
     def get_required_operations(
         self, conformance_classes: list[ConformanceClass]
     ) -> dict[str, list[str]]:
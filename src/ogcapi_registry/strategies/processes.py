@@ -4,7 +4,12 @@ from typing import Any, ClassVar
 
 from ..models import ValidationResult
 from ..ogc_types import ConformanceClass, OGCAPIType
-from .base import ValidationStrategy
+from .base import (
+    EMPTY_PATHS,
+    ValidationStrategy,
+    cached_required_operations,
+    cached_required_paths,
+)
 
 
 class ProcessesStrategy(ValidationStrategy):
@@ -14,6 +19,8 @@ class ProcessesStrategy(ValidationStrategy):
     specification (Part 1: Core).
     """
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.PROCESSES
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-processes",
@@ -76,6 +83,7 @@ class ProcessesStrategy(ValidationStrategy):
 
         return ValidationResult.success(warnings=tuple(warnings))
 
+    @cached_required_paths
     def get_required_paths(
         self,
         conformance_classes: list[ConformanceClass],
@@ -108,6 +116,7 @@ class ProcessesStrategy(ValidationStrategy):
 
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self,
         conformance_classes: list[ConformanceClass],
@@ -150,7 +159,7 @@ class ProcessesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         processes = paths.get("/processes", {})
         get_op = processes.get("get", {})
@@ -182,7 +191,7 @@ class ProcessesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Find execution path
         execution_path = None
@@ -233,7 +242,7 @@ class ProcessesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         jobs = paths.get("/jobs", {})
         get_op = jobs.get("get", {})
@@ -265,7 +274,7 @@ class ProcessesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Find job status path
         job_path = None
@@ -308,4 +317,4 @@ class ProcessesStrategy(ValidationStrategy):
     ) -> bool:
         """Check if a conformance class matching the pattern exists."""
         pattern_lower = pattern.lower()
-        return any(pattern_lower in cc.uri.lower() for cc in conformance_classes)
+        return any(pattern_lower in cc.uri_lower for cc in conformance_classes)
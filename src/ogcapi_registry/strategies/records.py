@@ -4,7 +4,7 @@ from typing import Any, ClassVar
 
 from ..models import ValidationResult
 from ..ogc_types import ConformanceClass, OGCAPIType
-from .base import ValidationStrategy
+from .base import EMPTY_PATHS, ValidationStrategy, cached_required_operations
 
 
 class RecordsStrategy(ValidationStrategy):
@@ -14,6 +14,8 @@ class RecordsStrategy(ValidationStrategy):
     specification (catalog/metadata services).
     """
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.RECORDS
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-records",
@@ -64,6 +66,7 @@ class RecordsStrategy(ValidationStrategy):
             "/collections/{catalogId}/items/{recordId}",
         ]
 
+    @cached_required_operations
     def get_required_operations(
         self,
         conformance_classes: list[ConformanceClass],
@@ -85,7 +88,7 @@ class RecordsStrategy(ValidationStrategy):
     ) -> list[dict[str, Any]]:
         """Validate records-specific requirements."""
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Find items path for records
         for path in paths:
@@ -117,4 +120,4 @@ class RecordsStrategy(ValidationStrategy):
         pattern: str,
     ) -> bool:
         pattern_lower = pattern.lower()
-        return any(pattern_lower in cc.uri.lower() for cc in conformance_classes)
+        return any(pattern_lower in cc.uri_lower for cc in conformance_classes)
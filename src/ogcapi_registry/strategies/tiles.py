@@ -4,7 +4,12 @@ from typing import Any, ClassVar
 
 from ..models import ValidationResult
 from ..ogc_types import ConformanceClass, OGCAPIType
-from .base import ValidationStrategy
+from .base import (
+    EMPTY_PATHS,
+    ValidationStrategy,
+    cached_required_operations,
+    cached_required_paths,
+)
 
 
 class TilesStrategy(ValidationStrategy):
@@ -14,6 +19,8 @@ class TilesStrategy(ValidationStrategy):
     specification.
     """
 
+    __slots__ = ()
+
     api_type: ClassVar[OGCAPIType] = OGCAPIType.TILES
     required_conformance_patterns: ClassVar[list[str]] = [
         "ogcapi-tiles",
@@ -65,6 +72,7 @@ class TilesStrategy(ValidationStrategy):
 
         return ValidationResult.success(warnings=tuple(warnings))
 
+    @cached_required_paths
     def get_required_paths(
         self,
         conformance_classes: list[ConformanceClass],
@@ -108,6 +116,7 @@ class TilesStrategy(ValidationStrategy):
 
         return paths
 
+    @cached_required_operations
     def get_required_operations(
         self,
         conformance_classes: list[ConformanceClass],
@@ -159,7 +168,7 @@ class TilesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Check for tileset metadata endpoint
         tileset_paths = [p for p in paths if "/tiles" in p and "tileMatrix" not in p]
@@ -192,7 +201,7 @@ class TilesStrategy(ValidationStrategy):
             List of validation errors
         """
         errors: list[dict[str, Any]] = []
-        paths = document.get("paths", {})
+        paths = document.get("paths") or EMPTY_PATHS
 
         # Find tile endpoints (contain tileMatrix, tileRow, tileCol)
         tile_paths = [
@@ -235,4 +244,4 @@ class TilesStrategy(ValidationStrategy):
     ) -> bool:
         """Check if a conformance class matching the pattern exists."""
         pattern_lower = pattern.lower()
-        return any(pattern_lower in cc.uri.lower() for cc in conformance_classes)
+        return any(pattern_lower in cc.uri_lower for cc in conformance_classes)
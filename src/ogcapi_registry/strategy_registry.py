@@ -1,9 +1,10 @@
 """Registry for validation strategies with auto-detection."""
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 
 from .models import ValidationResult
-from .strategies.base import ValidationStrategy
 from .ogc_types import (
     ConformanceClass,
     OGCAPIType,
@@ -25,10 +26,44 @@ from .strategies import (
     StylesStrategy,
     TilesStrategy,
 )
+from .strategies.base import EMPTY_PATHS, ValidationStrategy
 
 if TYPE_CHECKING:
     from .ogc_registry import OGCSpecificationRegistry
 
+# Locations where a document may declare its conformance classes, in order:
+# the info x-conformance extension, then the top-level x-conformsTo
+_CONFORMANCE_EXTRACTORS: tuple[Callable[[dict[str, Any]], Any], ...] = (
+    lambda document: (document.get("info") or {}).get("x-conformance"),
+    lambda document: document.get("x-conformsTo"),
+)
+
+# Maximum number of conformance sets whose strategy selection is remembered
+_SELECTION_CACHE_SIZE = 128
+
+# Path fragments that identify OGC API - EDR query endpoints
+_EDR_QUERY_MARKERS = ("position", "area", "cube", "trajectory", "corridor")
+
+# Default strategies are stateless, so they are built once at import and
+# shared by every StrategyRegistry instance.
+_DEFAULT_STRATEGIES: Mapping[OGCAPIType, ValidationStrategyProtocol] = MappingProxyType(
+    {
+        strategy.api_type: strategy
+        for strategy in (
+            CommonStrategy(),
+            FeaturesStrategy(),
+            TilesStrategy(),
+            ProcessesStrategy(),
+            RecordsStrategy(),
+            CoveragesStrategy(),
+            EDRStrategy(),
+            MapsStrategy(),
+            StylesStrategy(),
+            RoutesStrategy(),
+        )
+    }
+)
+
 
 class StrategyRegistry:
     """Registry for OGC API validation strategies.
@@ -62,20 +97,17 @@ class StrategyRegistry:
     def __init__(self) -> None:
         """Initialize the registry with default strategies."""
         self._strategies: dict[OGCAPIType, ValidationStrategyProtocol] = {}
+        # Strategy selected per conformance tuple, stored with the registered
+        # strategies it was computed from so any change invalidates it
+        self._selection_cache: dict[
+            tuple[ConformanceClass, ...],
+            tuple[tuple[ValidationStrategyProtocol, ...], ValidationStrategyProtocol],
+        ] = {}
         self._register_default_strategies()
 
     def _register_default_strategies(self) -> None:
         """Register all default OGC API strategies."""
-        self.register(CommonStrategy())
-        self.register(FeaturesStrategy())
-        self.register(TilesStrategy())
-        self.register(ProcessesStrategy())
-        self.register(RecordsStrategy())
-        self.register(CoveragesStrategy())
-        self.register(EDRStrategy())
-        self.register(MapsStrategy())
-        self.register(StylesStrategy())
-        self.register(RoutesStrategy())
+        self._strategies.update(_DEFAULT_STRATEGIES)
 
     def register(self, strategy: ValidationStrategyProtocol) -> None:
         """Register a validation strategy.
@@ -106,6 +138,34 @@ class StrategyRegistry:
         If multiple strategies match, returns a CompositeValidationStrategy
         that combines all matching strategies.
 
+        Args:
+            conformance_classes: List of conformance classes
+
+        Returns:
+            The best matching strategy (may be composite)
+        """
+        registered = tuple(self._strategies.values())
+        try:
+            key = tuple(conformance_classes)
+            cached = self._selection_cache.get(key)
+        except TypeError:  # unhashable duck-typed conformance classes
+            return self._select_strategy(conformance_classes)
+
+        if cached is not None and cached[0] == registered:
+            return cached[1]
+
+        strategy = self._select_strategy(conformance_classes)
+        if len(self._selection_cache) >= _SELECTION_CACHE_SIZE:
+            self._selection_cache.clear()
+        self._selection_cache[key] = (registered, strategy)
+        return strategy
+
+    def _select_strategy(
+        self,
+        conformance_classes: list[ConformanceClass],
+    ) -> ValidationStrategyProtocol:
+        """Score every registered strategy and pick the best match.
+
         Args:
             conformance_classes: List of conformance classes
 
@@ -121,7 +181,9 @@ class StrategyRegistry:
 
         if not matching_strategies:
             # Fall back to CommonStrategy
-            return self._strategies.get(OGCAPIType.COMMON, CommonStrategy())
+            return self._strategies.get(
+                OGCAPIType.COMMON, _DEFAULT_STRATEGIES[OGCAPIType.COMMON]
+            )
 
         # Sort by score (highest first)
         matching_strategies.sort(key=lambda x: x[0], reverse=True)
@@ -165,16 +227,7 @@ class StrategyRegistry:
             ValidationResult with validation outcome
         """
         # Parse conformance classes if needed
-        cc_list: list[ConformanceClass]
-
-        if conformance_classes is None:
-            cc_list = self._extract_conformance_from_document(document)
-        elif isinstance(conformance_classes, dict):
-            cc_list = parse_conformance_classes(conformance_classes)
-        elif conformance_classes and isinstance(conformance_classes[0], str):
-            cc_list = parse_conformance_classes(conformance_classes)  # type: ignore
-        else:
-            cc_list = conformance_classes  # type: ignore
+        cc_list = self._coerce_conformance_classes(document, conformance_classes)
 
         # Get the appropriate strategy
         strategy = self.get_for_conformance(cc_list)
@@ -182,6 +235,31 @@ class StrategyRegistry:
         # Validate
         return strategy.validate(document, cc_list)
 
+    def _coerce_conformance_classes(
+        self,
+        document: dict[str, Any],
+        conformance_classes: list[ConformanceClass] | list[str] | dict[str, Any] | None,
+    ) -> list[ConformanceClass]:
+        """Normalize any accepted conformance input to ConformanceClass objects.
+
+        Entry points call this once, so strategies always receive parsed
+        conformance classes and never re-check the input shape.
+
+        Args:
+            document: The OpenAPI document, used when no classes are given
+            conformance_classes: Conformance classes in any supported format
+
+        Returns:
+            List of conformance classes
+        """
+        if conformance_classes is None:
+            return self._extract_conformance_from_document(document)
+        if isinstance(conformance_classes, dict):
+            return parse_conformance_classes(conformance_classes)
+        if conformance_classes and isinstance(conformance_classes[0], str):
+            return parse_conformance_classes(cast(list[str], conformance_classes))
+        return cast(list[ConformanceClass], conformance_classes)
+
     def _extract_conformance_from_document(
         self,
         document: dict[str, Any],
@@ -200,16 +278,10 @@ class StrategyRegistry:
         """
         conformance_classes: list[ConformanceClass] = []
 
-        # Check for x-conformance extension
-        info = document.get("info", {})
-        x_conformance = info.get("x-conformance", [])
-        if x_conformance:
-            conformance_classes.extend(parse_conformance_classes(x_conformance))
-
-        # Also check top-level x-conformsTo
-        x_conforms_to = document.get("x-conformsTo", [])
-        if x_conforms_to:
-            conformance_classes.extend(parse_conformance_classes(x_conforms_to))
+        for extract in _CONFORMANCE_EXTRACTORS:
+            declared = extract(document)
+            if declared:
+                conformance_classes.extend(parse_conformance_classes(declared))
 
         # If no conformance found, infer from paths
         if not conformance_classes:
@@ -231,13 +303,15 @@ class StrategyRegistry:
         Returns:
             List of inferred conformance classes
         """
-        paths = document.get("paths", {})
-        path_set = set(paths.keys())
+        paths = document.get("paths") or EMPTY_PATHS
+        # Join the paths once so every substring probe below is a single
+        # scan of one string rather than a Python loop over all paths
+        joined_paths = "\n".join(paths)
 
         inferred: list[ConformanceClass] = []
 
         # Always add common core if we have basic OGC API structure
-        if "/" in path_set and "/conformance" in path_set:
+        if "/" in paths and "/conformance" in paths:
             inferred.append(
                 ConformanceClass(
                     uri="http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/core"
@@ -245,12 +319,12 @@ class StrategyRegistry:
             )
 
         # Check for Features patterns
-        has_collections = "/collections" in path_set
-        has_items = any("/items" in p for p in path_set)
+        has_collections = "/collections" in paths
+        has_items = "/items" in joined_paths
         if has_collections and has_items:
             # Check if it looks like Features (has featureId) vs Records (has recordId)
-            has_feature_id = any("featureId" in p for p in path_set)
-            has_record_id = any("recordId" in p for p in path_set)
+            has_feature_id = "featureId" in joined_paths
+            has_record_id = "recordId" in joined_paths
 
             if has_feature_id or (not has_record_id and has_items):
                 inferred.append(
@@ -267,8 +341,8 @@ class StrategyRegistry:
                 )
 
         # Check for Tiles patterns
-        has_tiles = any("/tiles" in p for p in path_set)
-        has_tile_matrix = any("tileMatrix" in p for p in path_set)
+        has_tiles = "/tiles" in joined_paths
+        has_tile_matrix = "tileMatrix" in joined_paths
         if has_tiles and has_tile_matrix:
             inferred.append(
                 ConformanceClass(
@@ -277,8 +351,8 @@ class StrategyRegistry:
             )
 
         # Check for Processes patterns
-        has_processes = "/processes" in path_set
-        has_execution = any("/execution" in p for p in path_set)
+        has_processes = "/processes" in paths
+        has_execution = "/execution" in joined_paths
         if has_processes and has_execution:
             inferred.append(
                 ConformanceClass(
@@ -287,7 +361,7 @@ class StrategyRegistry:
             )
 
         # Check for Maps patterns
-        has_map = any("/map" in p for p in path_set)
+        has_map = "/map" in joined_paths
         if has_map and has_collections:
             inferred.append(
                 ConformanceClass(
@@ -296,7 +370,7 @@ class StrategyRegistry:
             )
 
         # Check for Coverages patterns
-        has_coverage = any("/coverage" in p for p in path_set)
+        has_coverage = "/coverage" in joined_paths
         if has_coverage and has_collections:
             inferred.append(
                 ConformanceClass(
@@ -305,8 +379,7 @@ class StrategyRegistry:
             )
 
         # Check for EDR patterns
-        edr_queries = ["position", "area", "cube", "trajectory", "corridor"]
-        has_edr = any(any(q in p for q in edr_queries) for p in path_set)
+        has_edr = any(marker in joined_paths for marker in _EDR_QUERY_MARKERS)
         if has_edr and has_collections:
             inferred.append(
                 ConformanceClass(
@@ -315,7 +388,7 @@ class StrategyRegistry:
             )
 
         # Check for Styles patterns
-        has_styles = "/styles" in path_set
+        has_styles = "/styles" in paths
         if has_styles:
             inferred.append(
                 ConformanceClass(
@@ -324,7 +397,7 @@ class StrategyRegistry:
             )
 
         # Check for Routes patterns
-        has_routes = "/routes" in path_set
+        has_routes = "/routes" in paths
         if has_routes:
             inferred.append(
                 ConformanceClass(
@@ -377,15 +450,7 @@ class StrategyRegistry:
         """
 
         # Parse conformance classes if needed
-        cc_list: list[ConformanceClass]
-        if conformance_classes is None:
-            cc_list = self._extract_conformance_from_document(document)
-        elif isinstance(conformance_classes, dict):
-            cc_list = parse_conformance_classes(conformance_classes)
-        elif conformance_classes and isinstance(conformance_classes[0], str):
-            cc_list = parse_conformance_classes(conformance_classes)  # type: ignore
-        else:
-            cc_list = conformance_classes  # type: ignore
+        cc_list = self._coerce_conformance_classes(document, conformance_classes)
 
         # Get the strategy for the API type
         strategy = self.get(spec_key.api_type)
@@ -472,15 +537,7 @@ class StrategyRegistry:
             Set of detected OGCSpecificationKey objects
         """
         # Parse conformance classes if needed
-        cc_list: list[ConformanceClass]
-        if conformance_classes is None:
-            cc_list = self._extract_conformance_from_document(document)
-        elif isinstance(conformance_classes, dict):
-            cc_list = parse_conformance_classes(conformance_classes)
-        elif conformance_classes and isinstance(conformance_classes[0], str):
-            cc_list = parse_conformance_classes(conformance_classes)  # type: ignore
-        else:
-            cc_list = conformance_classes  # type: ignore
+        cc_list = self._coerce_conformance_classes(document, conformance_classes)
 
         return get_specification_keys(cc_list)
 
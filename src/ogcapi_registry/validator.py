@@ -1,21 +1,53 @@
 """Validation functions for OpenAPI documents."""
 
+import asyncio
+import re
+from collections.abc import Mapping
+from hashlib import blake2b
+from json import JSONDecodeError
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 from openapi_pydantic import OpenAPI as OpenAPI31
 from openapi_pydantic.v3.v3_0 import OpenAPI as OpenAPI30
+from pydantic import BaseModel
 from pydantic import ValidationError as PydanticValidationError
 
+from ._parsing import YamlLoader, json_loads
+from .client import AsyncOpenAPIClient, OpenAPIClient
 from .exceptions import ParseError
 from .models import (
     RegisteredSpecification,
-    SpecificationKey,
+    SpecificationMetadata,
     SpecificationType,
     ValidationResult,
+    _spec_key,
 )
+from .protocols import OpenAPIClientProtocol
 from .registry import SpecificationRegistry
 
+# openapi-pydantic model used to validate each specification type; the
+# models build their validators once, at import
+_OPENAPI_MODELS: Mapping[SpecificationType, type[BaseModel]] = MappingProxyType(
+    {
+        SpecificationType.OPENAPI_3_0: OpenAPI30,
+        SpecificationType.OPENAPI_3_1: OpenAPI31,
+    }
+)
+
+# Content starting with "{" or "[" (after whitespace) is tried as JSON first
+_JSON_START_RE = re.compile(r"\s*[\[{]")
+_JSON_START_BYTES_RE = re.compile(rb"\s*[\[{]")
+
+# Maximum number of (document, reference) results an OpenAPIValidator keeps
+_VALIDATOR_CACHE_SIZE = 128
+
+# Results of validating serialized documents, keyed by content digest and
+# format hint; cleared wholesale once it reaches _DOCUMENT_CACHE_SIZE entries
+_DOCUMENT_CACHE_SIZE = 256
+_document_results: dict[tuple[bytes, str | None], ValidationResult] = {}
+
 
 def parse_openapi_content(
     content: str | bytes, format_hint: str | None = None
@@ -32,28 +64,39 @@ def parse_openapi_content(
     Raises:
         ParseError: If parsing fails
     """
-    if isinstance(content, bytes):
-        content = content.decode("utf-8")
-
+    # Bytes are handed to the parsers as-is; both detect the encoding
     try:
         if format_hint == "json":
-            import json
-
-            return json.loads(content)
+            return json_loads(content)
         elif format_hint == "yaml":
-            return yaml.safe_load(content)
-        else:
+            return yaml.load(content, Loader=YamlLoader)
+        elif _looks_like_json(content):
             # Try JSON first, fall back to YAML
-            import json
-
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return yaml.safe_load(content)
+                return json_loads(content)
+            except JSONDecodeError:
+                return yaml.load(content, Loader=YamlLoader)
+        else:
+            # Not a JSON object or array; YAML also covers bare JSON scalars
+            return yaml.load(content, Loader=YamlLoader)
     except Exception as e:
         raise ParseError(f"Failed to parse content: {e}")
 
 
+def _looks_like_json(content: str | bytes) -> bool:
+    """Check whether content starts like a JSON object or array.
+
+    Args:
+        content: The content to inspect
+
+    Returns:
+        True if the first non-whitespace character is "{" or "["
+    """
+    if isinstance(content, bytes):
+        return _JSON_START_BYTES_RE.match(content) is not None
+    return _JSON_START_RE.match(content) is not None
+
+
 def validate_openapi_structure(
     document: dict[str, Any],
     target_version: SpecificationType | None = None,
@@ -158,7 +201,7 @@ def validate_openapi_structure(
                 }
             )
 
-    key = SpecificationKey(spec_type=detected_type, version=openapi_version)
+    key = _spec_key(detected_type, openapi_version)
 
     if errors:
         return ValidationResult.failure(
@@ -187,17 +230,14 @@ def validate_openapi_with_pydantic(
     openapi_version = document.get("openapi", "")
     try:
         spec_type = SpecificationType.from_version(openapi_version)
-        key = SpecificationKey(spec_type=spec_type, version=openapi_version)
+        key = _spec_key(spec_type, openapi_version)
     except ValueError:
         # If we can't determine version, skip Pydantic validation
         return ValidationResult.success()
 
     # Validate with appropriate OpenAPI model based on version
     try:
-        if spec_type == SpecificationType.OPENAPI_3_0:
-            OpenAPI30.model_validate(document)
-        else:
-            OpenAPI31.model_validate(document)
+        _OPENAPI_MODELS[spec_type].model_validate(document)
     except PydanticValidationError as e:
         for error in e.errors():
             loc = "/".join(str(p) for p in error["loc"]) or "/"
@@ -319,6 +359,10 @@ def validate_document(
     """Validate an OpenAPI document.
 
     This is a convenience function that parses and validates in one step.
+    Results for JSON or YAML strings are cached by a digest of the content.
+    Results without errors or warnings are shared between callers; any
+    other cached result is handed out as a copy with fresh error and
+    warning dicts, so callers cannot alter what later callers see.
 
     Args:
         document: The document to validate (dict, JSON string, or YAML string)
@@ -328,19 +372,79 @@ def validate_document(
         ValidationResult with validation outcome
     """
     if isinstance(document, (str, bytes)):
-        try:
-            document = parse_openapi_content(document, format_hint)
-        except ParseError as e:
-            return ValidationResult.failure(
-                [
-                    {
-                        "path": "/",
-                        "message": str(e),
-                        "type": "parse_error",
-                    }
-                ]
-            )
+        content = (
+            document.encode("utf-8", "surrogatepass")
+            if isinstance(document, str)
+            else document
+        )
+        key = (blake2b(content, digest_size=16).digest(), format_hint)
+        result = _document_results.get(key)
+        if result is None:
+            result = _validate_serialized_document(document, format_hint)
+            if len(_document_results) >= _DOCUMENT_CACHE_SIZE:
+                _document_results.clear()
+            _document_results[key] = result
+        return _detached(result)
+
+    return _validate_parsed_document(document)
+
+
+def _detached(result: ValidationResult) -> ValidationResult:
+    """Return a result whose error and warning dicts are not shared.
+
+    Args:
+        result: A result that may be handed out to several callers
+
+    Returns:
+        The result itself when it carries no dicts, otherwise a copy
+    """
+    if not result.errors and not result.warnings:
+        return result
+    return ValidationResult.model_construct(
+        is_valid=result.is_valid,
+        errors=tuple(dict(error) for error in result.errors),
+        warnings=tuple(dict(warning) for warning in result.warnings),
+        validated_against=result.validated_against,
+    )
+
+
+def _validate_serialized_document(
+    document: str | bytes,
+    format_hint: str | None,
+) -> ValidationResult:
+    """Parse and validate a JSON or YAML document.
+
+    Args:
+        document: The serialized document
+        format_hint: Optional hint about format ('json' or 'yaml')
+
+    Returns:
+        ValidationResult with validation outcome
+    """
+    try:
+        parsed = parse_openapi_content(document, format_hint)
+    except ParseError as e:
+        return ValidationResult.failure(
+            [
+                {
+                    "path": "/",
+                    "message": str(e),
+                    "type": "parse_error",
+                }
+            ]
+        )
+    return _validate_parsed_document(parsed)
+
 
+def _validate_parsed_document(document: dict[str, Any]) -> ValidationResult:
+    """Validate the structure and schema of a parsed OpenAPI document.
+
+    Args:
+        document: The parsed document
+
+    Returns:
+        ValidationResult with validation outcome
+    """
     # First validate structure
     structure_result = validate_openapi_structure(document)
     if not structure_result.is_valid:
@@ -368,6 +472,11 @@ class OpenAPIValidator:
 
     This class provides validation methods that can validate documents
     against specifications stored in a registry.
+
+    Results of validating a dict against a reference are memoized by the
+    identity of both objects. Mutation is not detected: a dict modified in
+    place after validation gets the result computed for its old contents,
+    so pass a new dict (or a copy) after changing a document.
     """
 
     def __init__(self, registry: SpecificationRegistry | None = None) -> None:
@@ -377,6 +486,10 @@ class OpenAPIValidator:
             registry: Optional registry to use. If not provided, a new one is created.
         """
         self._registry = registry or SpecificationRegistry()
+        self._results: dict[
+            tuple[int, int, bool],
+            tuple[dict[str, Any], RegisteredSpecification, ValidationResult],
+        ] = {}
 
     @property
     def registry(self) -> SpecificationRegistry:
@@ -421,10 +534,14 @@ class OpenAPIValidator:
 
         Raises:
             SpecificationNotFoundError: If reference specification not found
+
+        Note:
+            Results for a dict document are memoized by object identity, so
+            changes made to the same dict in place are not detected.
         """
         if isinstance(document, (str, bytes)):
             try:
-                document = parse_openapi_content(document, format_hint)
+                parsed = parse_openapi_content(document, format_hint)
             except ParseError as e:
                 return ValidationResult.failure(
                     [
@@ -435,9 +552,12 @@ class OpenAPIValidator:
                         }
                     ]
                 )
+            # A freshly parsed dict is never seen again, so skip the memo
+            reference = self._registry.get(spec_type, version)
+            return validate_against_reference(parsed, reference, strict=strict)
 
         reference = self._registry.get(spec_type, version)
-        return validate_against_reference(document, reference, strict=strict)
+        return self._validate_against_reference(document, reference, strict)
 
     def validate_against_latest(
         self,
@@ -459,26 +579,16 @@ class OpenAPIValidator:
 
         Raises:
             SpecificationNotFoundError: If no specifications of this type exist
-        """
-        # Find latest version for this type
-        specs = [
-            s
-            for s in self._registry.list_specifications()
-            if s.key.spec_type == spec_type
-        ]
-
-        if not specs:
-            from .exceptions import SpecificationNotFoundError
 
-            raise SpecificationNotFoundError(spec_type.value, "any")
-
-        # Sort by version and get latest
-        specs.sort(key=lambda s: s.key.version, reverse=True)
-        latest = specs[0]
+        Note:
+            Results for a dict document are memoized by object identity, so
+            changes made to the same dict in place are not detected.
+        """
+        latest = self._registry.get_latest(spec_type)
 
         if isinstance(document, (str, bytes)):
             try:
-                document = parse_openapi_content(document, format_hint)
+                parsed = parse_openapi_content(document, format_hint)
             except ParseError as e:
                 return ValidationResult.failure(
                     [
@@ -489,22 +599,93 @@ class OpenAPIValidator:
                         }
                     ]
                 )
+            return validate_against_reference(parsed, latest, strict=strict)
+
+        return self._validate_against_reference(document, latest, strict)
 
-        return validate_against_reference(document, latest, strict=strict)
+    def _validate_against_reference(
+        self,
+        document: dict[str, Any],
+        reference: RegisteredSpecification,
+        strict: bool,
+    ) -> ValidationResult:
+        """Validate against a reference, reusing the result for the same objects.
+
+        Entries are keyed by id() and hold the document and reference
+        themselves. A hit is used only if both stored objects are the ones
+        passed in, checked with ``is``. Holding them also stops their ids
+        from being reused while the entry exists. The contents are not
+        compared, so in-place mutation of the document is not detected.
+
+        Args:
+            document: The parsed document to validate
+            reference: The reference specification to validate against
+            strict: If True, require exact version match
+
+        Returns:
+            ValidationResult with validation outcome
+        """
+        key = (id(document), id(reference), strict)
+        cached = self._results.get(key)
+        if cached is not None and cached[0] is document and cached[1] is reference:
+            return _detached(cached[2])
+
+        result = validate_against_reference(document, reference, strict=strict)
+        if len(self._results) >= _VALIDATOR_CACHE_SIZE:
+            self._results.clear()
+        self._results[key] = (document, reference, result)
+        return _detached(result)
 
 
 def create_validator_with_specs(
     *urls: str,
+    client: OpenAPIClientProtocol | None = None,
 ) -> OpenAPIValidator:
     """Create a validator pre-loaded with specifications from URLs.
 
+    Specifications are registered in the order given, so a later URL still
+    overrides an earlier one with the same key. Without an injected client,
+    several URLs are fetched concurrently over one connection pool, or one
+    after another over one pool inside a running event loop.
+
     Args:
         *urls: URLs of OpenAPI specifications to load
+        client: Optional client used by the registry to fetch every URL.
+            If provided, the URLs are fetched one after another through it.
 
     Returns:
         OpenAPIValidator with loaded specifications
     """
-    registry = SpecificationRegistry()
-    for url in urls:
-        registry.register_from_url(url, overwrite=True)
+    registry = SpecificationRegistry(client=client)
+    if client is not None or len(urls) < 2:
+        for url in urls:
+            registry.register_from_url(url, overwrite=True)
+        return OpenAPIValidator(registry)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        fetched = asyncio.run(_fetch_all(urls))
+    else:
+        fetched = OpenAPIClient().fetch_many_and_validate_structure(urls)
+
+    for content, metadata in fetched:
+        registry.register_fetched(content, metadata, overwrite=True)
     return OpenAPIValidator(registry)
+
+
+async def _fetch_all(
+    urls: tuple[str, ...],
+) -> list[tuple[dict[str, Any], SpecificationMetadata]]:
+    """Fetch and structurally check several specifications concurrently.
+
+    The requests share one httpx client, so connections to the same host
+    are pooled and reused.
+
+    Args:
+        urls: URLs of OpenAPI specifications to fetch
+
+    Returns:
+        (content, metadata) pairs in the order of urls
+    """
+    return await AsyncOpenAPIClient().fetch_many_and_validate_structure(urls)
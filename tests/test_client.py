@@ -155,6 +155,21 @@ class TestOpenAPIClient:
         with pytest.raises(ParseError, match="Unsupported OpenAPI version"):
             client.fetch_and_validate_structure("https://example.com/openapi.json")
 
+    def test_fetch_many_and_validate_structure(
+        self, httpx_mock, client, valid_openapi_json
+    ):
+        """Test fetching several specs over one client keeps the URL order."""
+        urls = ["https://example.com/a.json", "https://example.com/b.json"]
+        for url in urls:
+            httpx_mock.add_response(
+                url=url,
+                content=valid_openapi_json.encode(),
+                headers={"content-type": "application/json"},
+            )
+
+        results = client.fetch_many_and_validate_structure(urls)
+        assert [metadata.source_url for _, metadata in results] == urls
+
 
 class TestAsyncOpenAPIClient:
     """Tests for AsyncOpenAPIClient."""
@@ -214,3 +229,19 @@ class TestAsyncOpenAPIClient:
             "https://example.com/openapi.json"
         )
         assert content["openapi"] == "3.0.3"
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_and_validate_structure(
+        self, httpx_mock, client, valid_openapi_json
+    ):
+        """Test fetching several specs concurrently keeps the URL order."""
+        urls = ["https://example.com/a.json", "https://example.com/b.json"]
+        for url in urls:
+            httpx_mock.add_response(
+                url=url,
+                content=valid_openapi_json.encode(),
+                headers={"content-type": "application/json"},
+            )
+
+        results = await client.fetch_many_and_validate_structure(urls)
+        assert [metadata.source_url for _, metadata in results] == urls
@@ -9,6 +9,7 @@ from ogcapi_registry.models import (
     SpecificationMetadata,
     SpecificationType,
     ValidationResult,
+    _spec_key,
 )
 
 
@@ -71,6 +72,38 @@ class TestSpecificationKey:
         d = {key1: "value1", key3: "value3"}
         assert d[key2] == "value1"
 
+    def test_spec_key_is_cached(self):
+        """Test that the key helper returns a shared, equal key."""
+        key = _spec_key(SpecificationType.OPENAPI_3_0, "3.0.3")
+        assert key is _spec_key(SpecificationType.OPENAPI_3_0, "3.0.3")
+        assert key == SpecificationKey(
+            spec_type=SpecificationType.OPENAPI_3_0, version="3.0.3"
+        )
+
+    def test_version_interned(self):
+        """Test that keys built from equal version strings share one string."""
+        patch = 3
+        version = f"3.0.{patch}"
+        key = SpecificationKey(spec_type=SpecificationType.OPENAPI_3_0, version=version)
+        other = SpecificationKey(
+            spec_type=SpecificationType.OPENAPI_3_0, version="3.0.3"
+        )
+        assert key.version is other.version
+        assert hash(key) == hash(other)
+        assert key == other
+
+    def test_model_copy_keeps_hash_consistent(self):
+        """Test that a copied key hashes like an equal freshly built key."""
+        key = SpecificationKey(spec_type=SpecificationType.OPENAPI_3_0, version="3.0.3")
+        hash(key)
+        copied = key.model_copy(update={"version": "3.0.2"})
+        fresh = SpecificationKey(
+            spec_type=SpecificationType.OPENAPI_3_0, version="3.0.2"
+        )
+        assert copied == fresh
+        assert hash(copied) == hash(fresh)
+        assert copied in {fresh: 1}
+
 
 class TestSpecificationMetadata:
     """Tests for SpecificationMetadata model."""
@@ -133,6 +166,22 @@ class TestRegisteredSpecification:
         """Test getting info version."""
         assert sample_spec.info_version == "1.0.0"
 
+    def test_accessors_follow_model_copy(self, sample_spec):
+        """Test that accessors read the raw content of a copied specification."""
+        assert sample_spec.info_title == "Test API"
+        copied = sample_spec.model_copy(
+            update={
+                "raw_content": {
+                    "openapi": "3.1.0",
+                    "info": {"title": "Other API", "version": "2.0.0"},
+                    "paths": {},
+                }
+            }
+        )
+        assert copied.openapi_version == "3.1.0"
+        assert copied.info_title == "Other API"
+        assert copied.info_version == "2.0.0"
+
     def test_to_openapi_works_for_3_0(self, sample_spec):
         """Test converting 3.0 spec to OpenAPI model."""
         openapi = sample_spec.to_openapi()
@@ -171,6 +220,10 @@ class TestValidationResult:
         assert result.errors == ()
         assert result.warnings == ()
 
+    def test_success_is_shared(self):
+        """Test that a plain success result is a shared instance."""
+        assert ValidationResult.success() is ValidationResult.success()
+
     def test_success_with_warnings(self):
         """Test creating a success result with warnings."""
         warnings = ({"path": "/", "message": "Warning"},)
@@ -186,6 +239,83 @@ class TestValidationResult:
         assert len(result.errors) == 1
         assert result.errors[0]["message"] == "Missing field"
 
+    def test_missing_paths_and_operations(self):
+        """Test that missing paths and operations are collected from errors."""
+        errors = [
+            {
+                "path": "paths//collections",
+                "type": "missing_required_path",
+                "required_path": "/collections",
+            },
+            {
+                "path": "paths//jobs/{jobId}/delete",
+                "type": "missing_required_operation",
+                "required_path": "/jobs/{jobId}",
+                "method": "delete",
+            },
+            {"path": "/info", "message": "Missing field"},
+        ]
+        result = ValidationResult.failure(errors)
+        assert result.missing_paths == frozenset({"/collections"})
+        assert result.missing_operations == {"/jobs/{jobId}": frozenset({"delete"})}
+        assert ValidationResult.success().missing_paths == frozenset()
+
+    def test_missing_paths_and_operations_follow_model_copy(self):
+        """Test that missing paths and operations reflect copied errors."""
+        result = ValidationResult.failure(
+            [
+                {
+                    "path": "paths//a",
+                    "type": "missing_required_path",
+                    "required_path": "/a",
+                },
+                {
+                    "path": "paths//a/get",
+                    "type": "missing_required_operation",
+                    "required_path": "/a",
+                    "method": "get",
+                },
+            ]
+        )
+        assert result.missing_paths == frozenset({"/a"})
+        assert result.missing_operations == {"/a": frozenset({"get"})}
+        copied = result.model_copy(
+            update={
+                "errors": (
+                    {
+                        "path": "paths//b/post",
+                        "type": "missing_required_operation",
+                        "required_path": "/b",
+                        "method": "post",
+                    },
+                )
+            }
+        )
+        assert copied.missing_paths == frozenset()
+        assert copied.missing_operations == {"/b": frozenset({"post"})}
+        with pytest.raises(TypeError):
+            copied.missing_operations["/c"] = frozenset()
+
+    def test_error_types(self):
+        """Test that error types are indexed for membership checks."""
+        errors = [
+            {"path": "openapi", "type": "type_mismatch"},
+            {"path": "/info", "message": "Missing field"},
+        ]
+        result = ValidationResult.failure(errors)
+        assert result.error_types == frozenset({"type_mismatch"})
+        assert result.has_error_type("type_mismatch")
+        assert not ValidationResult.success().has_error_type("type_mismatch")
+
+    def test_error_types_follow_model_copy(self):
+        """Test that error types reflect errors changed through model_copy."""
+        result = ValidationResult.failure([{"path": "/", "type": "x"}])
+        assert result.error_types == frozenset({"x"})
+        copied = result.model_copy(update={"errors": ({"path": "/", "type": "y"},)})
+        assert copied.error_types == frozenset({"y"})
+        assert copied.has_error_type("y")
+        assert not copied.has_error_type("x")
+
     def test_failure_with_key(self):
         """Test creating a failure result with validation key."""
         key = SpecificationKey(spec_type=SpecificationType.OPENAPI_3_0, version="3.0.3")
@@ -39,6 +39,31 @@ class TestConformanceClass:
         )
         assert cc.uri == "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core"
 
+    def test_uri_lower_follows_model_copy(self):
+        """Test that uri_lower reflects a URI changed through model_copy."""
+        cc = ConformanceClass(uri="http://example.com/FEATURES")
+        assert cc.uri_lower == "http://example.com/features"
+        copied = cc.model_copy(update={"uri": "http://example.com/TILES"})
+        assert copied.uri_lower == "http://example.com/tiles"
+
+    def test_derived_properties_follow_model_copy(self):
+        """Test that derived properties reflect a URI changed through model_copy."""
+        cc = ConformanceClass(
+            uri="http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core"
+        )
+        assert cc.specification_key is not None
+        copied = cc.model_copy(
+            update={
+                "uri": "http://www.opengis.net/spec/ogcapi-tiles-2/1.1/conf/tileset"
+            }
+        )
+        assert copied.api_type == OGCAPIType.TILES
+        assert copied.part == 2
+        assert copied.spec_version == "1.1"
+        assert copied.conformance_class_name == "tileset"
+        assert copied.specification_key is not None
+        assert copied.specification_key.api_type == OGCAPIType.TILES
+
     def test_api_type_detection_features(self):
         """Test detecting Features API type."""
         cc = ConformanceClass(
@@ -107,6 +132,13 @@ class TestConformanceClass:
         assert hash(cc1) == hash(cc2)
         assert cc1 == cc2
 
+    def test_uri_is_interned(self):
+        """Test that equal URIs built at runtime share one string object."""
+        base = "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/"
+        cc1 = ConformanceClass(uri=base + "core")
+        cc2 = ConformanceClass(uri=base + "core")
+        assert cc1.uri is cc2.uri
+
     def test_equality_with_string(self):
         """Test equality comparison with string."""
         cc = ConformanceClass(
@@ -1,5 +1,8 @@
 """Tests for Protocol compliance and duck typing support."""
 
+from collections.abc import Collection, Mapping
+from types import MappingProxyType
+
 from ogcapi_registry import (
     AsyncOpenAPIClient,
     CommonStrategy,
@@ -19,6 +22,8 @@ from ogcapi_registry.protocols import (
     VersionAwareStrategyProtocol,
 )
 
+_EMPTY_PATHS = MappingProxyType({})
+
 
 class TestValidationStrategyProtocol:
     """Tests for ValidationStrategyProtocol duck typing support."""
@@ -44,7 +49,10 @@ class TestValidationStrategyProtocol:
         class CustomStrategy:
             """A strategy that doesn't inherit from ValidationStrategy."""
 
+            __slots__ = ()
+
             api_type = OGCAPIType.COMMON
+            _OPS = MappingProxyType({"/": ("get",)})
 
             def validate(
                 self,
@@ -56,8 +64,10 @@ class TestValidationStrategyProtocol:
             def get_required_paths(self, conformance_classes: list) -> list:
                 return ["/"]
 
-            def get_required_operations(self, conformance_classes: list) -> dict:
-                return {"/": ["get"]}
+            def get_required_operations(
+                self, conformance_classes: list
+            ) -> Mapping[str, Collection[str]]:
+                return self._OPS
 
             def matches_conformance(self, conformance_classes: list) -> bool:
                 return True
@@ -86,14 +96,17 @@ class TestValidationStrategyProtocol:
         class MinimalFeaturesStrategy:
             """Minimal Features strategy without inheritance."""
 
+            __slots__ = ()
+
             api_type = OGCAPIType.FEATURES
+            _OPS = MappingProxyType({"/collections": ("get",)})
 
             def validate(
                 self,
                 document: dict,
                 conformance_classes: list,
             ) -> ValidationResult:
-                paths = document.get("paths", {})
+                paths = document.get("paths") or _EMPTY_PATHS
                 if "/collections" not in paths:
                     return ValidationResult.failure(
                         [
@@ -109,11 +122,13 @@ class TestValidationStrategyProtocol:
             def get_required_paths(self, conformance_classes: list) -> list:
                 return ["/collections"]
 
-            def get_required_operations(self, conformance_classes: list) -> dict:
-                return {"/collections": ["get"]}
+            def get_required_operations(
+                self, conformance_classes: list
+            ) -> Mapping[str, Collection[str]]:
+                return self._OPS
 
             def matches_conformance(self, conformance_classes: list) -> bool:
-                return any("features" in str(cc).lower() for cc in conformance_classes)
+                return any("features" in cc.uri_lower for cc in conformance_classes)
 
         registry = StrategyRegistry()
         registry.register(MinimalFeaturesStrategy())
@@ -164,6 +179,8 @@ class TestConformanceClassProtocol:
         class SimpleConformance:
             """Simple conformance class without inheritance."""
 
+            __slots__ = ("_uri",)
+
             def __init__(self, uri: str):
                 self._uri = uri
 
@@ -200,6 +217,8 @@ class TestOpenAPIClientProtocol:
 class TestRegistryProtocol:
     """Tests for RegistryProtocol."""
 
+    _REQ = frozenset({"clear", "list_keys", "__len__", "__contains__"})
+
     def test_specification_registry_partial_protocol(self) -> None:
         """Test SpecificationRegistry methods align with protocol patterns.
 
@@ -209,10 +228,7 @@ class TestRegistryProtocol:
         registry = SpecificationRegistry()
 
         # Has similar methods
-        assert hasattr(registry, "clear")
-        assert hasattr(registry, "list_keys")
-        assert callable(getattr(registry, "__len__", None))
-        assert callable(getattr(registry, "__contains__", None))
+        assert self._REQ <= frozenset(dir(type(registry)))
 
 
 class TestProtocolRuntimeChecking:
@@ -236,6 +252,8 @@ class TestProtocolRuntimeChecking:
         class IncompleteStrategy:
             """Missing required methods."""
 
+            __slots__ = ()
+
             api_type = OGCAPIType.COMMON
 
             def validate(self, document, conformance_classes):
@@ -248,6 +266,13 @@ class TestProtocolRuntimeChecking:
         # Should NOT satisfy the protocol because methods are missing
         assert not isinstance(incomplete, ValidationStrategyProtocol)
 
+    def test_issubclass_uses_class_members(self) -> None:
+        """Test that protocols support issubclass via their member sets."""
+        assert issubclass(FeaturesStrategy, ValidationStrategyProtocol)
+        assert issubclass(FeaturesStrategy, VersionAwareStrategyProtocol)
+        assert issubclass(OpenAPIClient, OpenAPIClientProtocol)
+        assert not issubclass(int, ValidationStrategyProtocol)
+
 
 class TestProtocolDocumentation:
     """Tests ensuring protocol documentation examples work."""
@@ -256,7 +281,10 @@ class TestProtocolDocumentation:
         """Test the example from ValidationStrategyProtocol docstring."""
 
         class CustomStrategy:
+            __slots__ = ()
+
             api_type = OGCAPIType.FEATURES
+            _OPS = MappingProxyType({"/collections": ("get",)})
 
             def validate(self, document, conformance_classes):
                 return ValidationResult.success()
@@ -265,7 +293,7 @@ class TestProtocolDocumentation:
                 return ["/collections"]
 
             def get_required_operations(self, conformance_classes):
-                return {"/collections": ["get"]}
+                return self._OPS
 
             def matches_conformance(self, conformance_classes):
                 return True
@@ -1,9 +1,12 @@
 """Tests for the registry module."""
 
 import json
+from types import MappingProxyType
 
+import httpx
 import pytest
 
+from ogcapi_registry.client import AsyncOpenAPIClient, OpenAPIClient
 from ogcapi_registry.exceptions import (
     SpecificationAlreadyExistsError,
     SpecificationNotFoundError,
@@ -18,7 +21,41 @@ from ogcapi_registry.registry import (
     SpecificationRegistry,
 )
 
+SPEC_URL = "https://example.com/openapi.json"
 
+
+def _json_transport(document: dict, url: str = SPEC_URL) -> httpx.MockTransport:
+    """Create a transport that serves a JSON document for GET requests to url."""
+    content = json.dumps(document).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET"
+        assert str(request.url) == url
+        return httpx.Response(
+            200, content=content, headers={"content-type": "application/json"}
+        )
+
+    return httpx.MockTransport(handler)
+
+
+# Built once per module; MockTransport serves both sync and async clients
+OPENAPI_30_TRANSPORT = _json_transport(
+    {
+        "openapi": "3.0.3",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {},
+    }
+)
+OPENAPI_31_TRANSPORT = _json_transport(
+    {
+        "openapi": "3.1.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {},
+    }
+)
+
+
+@pytest.mark.xdist_group("registry_sync")
 class TestSpecificationRegistry:
     """Tests for SpecificationRegistry."""
 
@@ -27,14 +64,16 @@ class TestSpecificationRegistry:
         """Create a fresh registry instance."""
         return SpecificationRegistry()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_content(self):
-        """Return sample OpenAPI content."""
-        return {
-            "openapi": "3.0.3",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {},
-        }
+        """Return sample OpenAPI content as a read-only mapping."""
+        return MappingProxyType(
+            {
+                "openapi": "3.0.3",
+                "info": {"title": "Test API", "version": "1.0.0"},
+                "paths": {},
+            }
+        )
 
     def test_register(self, registry, sample_content):
         """Test registering a specification."""
@@ -56,7 +95,7 @@ class TestSpecificationRegistry:
             version="3.0.3",
             metadata=metadata,
         )
-        assert spec.metadata.source_url == "https://example.com/openapi.json"
+        assert spec.metadata.source_url == SPEC_URL
 
     def test_register_duplicate_raises_error(self, registry, sample_content):
         """Test that registering a duplicate raises an error."""
@@ -81,10 +120,8 @@ class TestSpecificationRegistry:
             version="3.0.3",
         )
 
-        updated_content = {
-            **sample_content,
-            "info": {"title": "Updated", "version": "2.0"},
-        }
+        updated_content = sample_content.copy()
+        updated_content["info"] = {"title": "Updated", "version": "2.0"}
         spec = registry.register(
             content=updated_content,
             spec_type=SpecificationType.OPENAPI_3_0,
@@ -145,6 +182,25 @@ class TestSpecificationRegistry:
         assert result is True
         assert registry.exists(SpecificationType.OPENAPI_3_0, "3.0.3") is False
 
+    def test_get_latest(self, registry, sample_content):
+        """Test that the latest version per type follows registration and removal."""
+        registry.register_many(
+            [
+                (sample_content, SpecificationType.OPENAPI_3_0, "3.0.2"),
+                (sample_content, SpecificationType.OPENAPI_3_0, "3.0.3"),
+            ]
+        )
+        latest = registry.get_latest(SpecificationType.OPENAPI_3_0)
+        assert latest.key.version == "3.0.3"
+
+        registry.remove(SpecificationType.OPENAPI_3_0, "3.0.3")
+        latest = registry.get_latest(SpecificationType.OPENAPI_3_0)
+        assert latest.key.version == "3.0.2"
+
+        registry.remove(SpecificationType.OPENAPI_3_0, "3.0.2")
+        with pytest.raises(SpecificationNotFoundError):
+            registry.get_latest(SpecificationType.OPENAPI_3_0)
+
     def test_remove_non_existent(self, registry):
         """Test removing a non-existent specification."""
         result = registry.remove(SpecificationType.OPENAPI_3_0, "3.0.3")
@@ -152,19 +208,37 @@ class TestSpecificationRegistry:
 
     def test_clear(self, registry, sample_content):
         """Test clearing all specifications."""
+        content_31 = sample_content.copy()
+        content_31["openapi"] = "3.1.0"
+        registry.register_many(
+            [
+                (sample_content, SpecificationType.OPENAPI_3_0, "3.0.3"),
+                (content_31, SpecificationType.OPENAPI_3_1, "3.1.0"),
+            ]
+        )
+        assert len(registry) == 2
+
+        registry.clear()
+        assert len(registry) == 0
+
+    def test_register_many_duplicate_is_atomic(self, registry, sample_content):
+        """Test that a batch with an existing key registers nothing."""
         registry.register(
             content=sample_content,
             spec_type=SpecificationType.OPENAPI_3_0,
             version="3.0.3",
         )
-        registry.register(
-            content={**sample_content, "openapi": "3.1.0"},
-            spec_type=SpecificationType.OPENAPI_3_1,
-            version="3.1.0",
-        )
 
-        registry.clear()
-        assert len(registry) == 0
+        with pytest.raises(SpecificationAlreadyExistsError):
+            registry.register_many(
+                [
+                    (sample_content, SpecificationType.OPENAPI_3_0, "3.0.2"),
+                    (sample_content, SpecificationType.OPENAPI_3_0, "3.0.3"),
+                ]
+            )
+
+        assert len(registry) == 1
+        assert not registry.exists(SpecificationType.OPENAPI_3_0, "3.0.2")
 
     def test_list_keys(self, registry, sample_content):
         """Test listing all keys."""
@@ -209,9 +283,9 @@ class TestSpecificationRegistry:
             version="3.0.3",
         )
 
-        specs = list(registry)
-        assert len(specs) == 1
-        assert specs[0].raw_content == sample_content
+        assert len(registry) == 1
+        spec = next(iter(registry))
+        assert spec.raw_content == sample_content
 
     def test_contains(self, registry, sample_content):
         """Test checking if key is in registry."""
@@ -227,46 +301,38 @@ class TestSpecificationRegistry:
 
         assert key in registry
 
-    def test_register_from_url(self, httpx_mock, registry):
+    def test_register_from_url(self):
         """Test registering from a URL."""
-        content = json.dumps(
-            {
-                "openapi": "3.0.3",
-                "info": {"title": "Test API", "version": "1.0.0"},
-                "paths": {},
-            }
-        )
-        httpx_mock.add_response(
-            url="https://example.com/openapi.json",
-            content=content.encode(),
-            headers={"content-type": "application/json"},
+        registry = SpecificationRegistry(
+            client=OpenAPIClient(transport=OPENAPI_30_TRANSPORT)
         )
 
-        spec = registry.register_from_url("https://example.com/openapi.json")
+        spec = registry.register_from_url(SPEC_URL)
         assert spec.key.spec_type == SpecificationType.OPENAPI_3_0
         assert spec.key.version == "3.0.3"
-        assert spec.metadata.source_url == "https://example.com/openapi.json"
+        assert spec.metadata.source_url == SPEC_URL
 
-    def test_register_from_url_infer_version(self, httpx_mock, registry):
+    def test_register_from_url_infer_version(self):
         """Test that version is inferred from content."""
-        content = json.dumps(
-            {
-                "openapi": "3.1.0",
-                "info": {"title": "Test API", "version": "1.0.0"},
-                "paths": {},
-            }
-        )
-        httpx_mock.add_response(
-            url="https://example.com/openapi.json",
-            content=content.encode(),
-            headers={"content-type": "application/json"},
+        registry = SpecificationRegistry(
+            client=OpenAPIClient(transport=OPENAPI_31_TRANSPORT)
         )
 
-        spec = registry.register_from_url("https://example.com/openapi.json")
+        spec = registry.register_from_url(SPEC_URL)
         assert spec.key.spec_type == SpecificationType.OPENAPI_3_1
         assert spec.key.version == "3.1.0"
 
+    def test_register_fetched(self, registry, sample_content):
+        """Test registering fetched content infers type and version."""
+        metadata = SpecificationMetadata(source_url=SPEC_URL)
+        spec = registry.register_fetched(dict(sample_content), metadata)
+        assert spec.key == SpecificationKey(
+            spec_type=SpecificationType.OPENAPI_3_0, version="3.0.3"
+        )
+        assert spec.metadata is metadata
+
 
+@pytest.mark.xdist_group("registry_async")
 class TestAsyncSpecificationRegistry:
     """Tests for AsyncSpecificationRegistry."""
 
@@ -275,14 +341,16 @@ class TestAsyncSpecificationRegistry:
         """Create a fresh async registry instance."""
         return AsyncSpecificationRegistry()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_content(self):
-        """Return sample OpenAPI content."""
-        return {
-            "openapi": "3.0.3",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {},
-        }
+        """Return sample OpenAPI content as a read-only mapping."""
+        return MappingProxyType(
+            {
+                "openapi": "3.0.3",
+                "info": {"title": "Test API", "version": "1.0.0"},
+                "paths": {},
+            }
+        )
 
     def test_register_sync(self, registry, sample_content):
         """Test that register works synchronously."""
@@ -293,25 +361,16 @@ class TestAsyncSpecificationRegistry:
         )
         assert spec.key.spec_type == SpecificationType.OPENAPI_3_0
 
-    @pytest.mark.asyncio
-    async def test_register_from_url(self, httpx_mock, registry):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_register_from_url(self):
         """Test registering from a URL asynchronously."""
-        content = json.dumps(
-            {
-                "openapi": "3.0.3",
-                "info": {"title": "Test API", "version": "1.0.0"},
-                "paths": {},
-            }
-        )
-        httpx_mock.add_response(
-            url="https://example.com/openapi.json",
-            content=content.encode(),
-            headers={"content-type": "application/json"},
+        registry = AsyncSpecificationRegistry(
+            client=AsyncOpenAPIClient(transport=OPENAPI_30_TRANSPORT)
         )
 
-        spec = await registry.register_from_url("https://example.com/openapi.json")
+        spec = await registry.register_from_url(SPEC_URL)
         assert spec.key.spec_type == SpecificationType.OPENAPI_3_0
-        assert spec.metadata.source_url == "https://example.com/openapi.json"
+        assert spec.metadata.source_url == SPEC_URL
 
     def test_get(self, registry, sample_content):
         """Test getting a specification."""
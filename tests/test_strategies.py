@@ -1,5 +1,8 @@
 """Tests for validation strategies."""
 
+import gc
+import weakref
+
 import pytest
 
 from ogcapi_registry.ogc_types import ConformanceClass, OGCAPIType
@@ -10,6 +13,7 @@ from ogcapi_registry.strategies import (
     ProcessesStrategy,
     TilesStrategy,
 )
+from ogcapi_registry.strategies.base import cached_required_paths
 
 
 class TestCommonStrategy:
@@ -72,6 +76,7 @@ class TestCommonStrategy:
         result = strategy.validate(doc, conformance_classes)
         assert not result.is_valid
         assert any("/" in e["path"] for e in result.errors)
+        assert "/" in result.missing_paths
 
 
 class TestFeaturesStrategy:
@@ -115,6 +120,14 @@ class TestFeaturesStrategy:
         assert "get" in ops["/collections"]
         assert "get" in ops["/collections/{collectionId}/items"]
 
+    def test_required_operations_are_shared(self, strategy, conformance_classes):
+        """Test that required operations are a shared read-only mapping."""
+        ops = strategy.get_required_operations(conformance_classes)
+        assert strategy.get_required_operations(conformance_classes) is ops
+        assert ops["/collections"] == frozenset({"get"})
+        with pytest.raises(TypeError):
+            ops["/extra"] = frozenset({"get"})  # type: ignore[index]
+
     def test_validate_valid_document(self, strategy, conformance_classes):
         """Test validating a valid Features document."""
         doc = {
@@ -238,6 +251,18 @@ class TestProcessesStrategy:
         assert "post" in ops["/processes/{processId}/execution"]
         assert "get" in ops["/jobs"]
 
+    def test_required_paths_cached_per_conformance(self, strategy, conformance_classes):
+        """Test that cached required paths are returned as fresh lists."""
+        paths = strategy.get_required_paths(conformance_classes)
+        paths.append("/mutated")
+        again = strategy.get_required_paths(conformance_classes)
+        assert "/mutated" not in again
+        assert "/jobs" in again
+
+        # A different conformance set is computed separately
+        core_only = strategy.get_required_paths(conformance_classes[:1])
+        assert "/jobs" not in core_only
+
 
 class TestCompositeValidationStrategy:
     """Tests for CompositeValidationStrategy."""
@@ -281,6 +306,11 @@ class TestCompositeValidationStrategy:
         assert any(isinstance(s, FeaturesStrategy) for s in composite.strategies)
         assert any(isinstance(s, TilesStrategy) for s in composite.strategies)
 
+    def test_strategies_have_no_instance_dict(self, composite):
+        """Test that strategies use slots instead of a per-instance dict."""
+        for strategy in (composite, *composite.strategies):
+            assert not hasattr(strategy, "__dict__")
+
 
 class TestPathMatching:
     """Tests for path pattern matching."""
@@ -310,3 +340,50 @@ class TestPathMatching:
     def test_no_match(self, strategy):
         """Test non-matching paths."""
         assert not strategy._path_matches_pattern("/other/path", "/collections")
+
+
+class TestRequirementCaching:
+    """Tests for the get_required_* memoization decorators."""
+
+    def test_cache_does_not_keep_strategy_alive(self):
+        """Test that a cached strategy can still be garbage collected."""
+        strategy = ProcessesStrategy()
+        strategy.get_required_paths(
+            [
+                ConformanceClass(
+                    uri="http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/core"
+                )
+            ]
+        )
+        ref = weakref.ref(strategy)
+        del strategy
+        gc.collect()
+        assert ref() is None
+
+    def test_matching_follows_updated_patterns(self):
+        """Test that matching and scoring read the same, current patterns."""
+
+        class CustomStrategy(CommonStrategy):
+            __slots__ = ()
+
+        CustomStrategy.required_conformance_patterns = ["example.com/conf/custom"]
+        strategy = CustomStrategy()
+        ccs = [ConformanceClass(uri="http://example.com/conf/custom")]
+        assert strategy.matches_conformance(ccs)
+        assert strategy.get_conformance_score(ccs) >= 10
+
+    def test_error_in_method_is_raised_once(self):
+        """Test that a TypeError raised by the method is not retried."""
+        calls = []
+
+        class FailingStrategy(CommonStrategy):
+            __slots__ = ()
+
+            @cached_required_paths
+            def get_required_paths(self, conformance_classes):
+                calls.append(conformance_classes)
+                raise TypeError("broken")
+
+        with pytest.raises(TypeError, match="broken"):
+            FailingStrategy().get_required_paths([])
+        assert len(calls) == 1
@@ -75,6 +75,22 @@ class TestStrategyRegistry:
         strategy = registry.get_for_conformance(ccs)
         assert strategy.api_type == OGCAPIType.COMMON
 
+    def test_get_for_conformance_reuses_selection(self, registry):
+        """Test that selection is remembered until the strategies change."""
+        ccs = [
+            ConformanceClass(
+                uri="http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core"
+            ),
+            ConformanceClass(
+                uri="http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/core"
+            ),
+        ]
+        first = registry.get_for_conformance(ccs)
+        assert registry.get_for_conformance(list(ccs)) is first
+
+        del registry._strategies[OGCAPIType.TILES]
+        assert isinstance(registry.get_for_conformance(ccs), FeaturesStrategy)
+
     def test_detect_and_validate_with_conformance(self, registry):
         """Test detect_and_validate with explicit conformance."""
         doc = {
@@ -1,6 +1,7 @@
 """Tests for the validator module."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -44,6 +45,12 @@ class TestParseOpenAPIContent:
         result = parse_openapi_content(content)
         assert result["openapi"] == "3.0.3"
 
+    def test_parse_sniffs_json_and_yaml(self):
+        """Test format detection without a hint, including YAML flow style."""
+        assert parse_openapi_content(b'\n  {"openapi": "3.0.3"}')["openapi"] == "3.0.3"
+        assert parse_openapi_content("{openapi: '3.0.3'}")["openapi"] == "3.0.3"
+        assert parse_openapi_content("openapi: '3.1.0'")["openapi"] == "3.1.0"
+
     def test_parse_with_format_hint_json(self):
         """Test parsing with JSON format hint."""
         content = '{"openapi": "3.0.3"}'
@@ -139,6 +146,17 @@ class TestValidateOpenAPIWithPydantic:
         assert result.is_valid
         assert result.validated_against.spec_type == SpecificationType.OPENAPI_3_0
 
+    def test_success_result_shared_per_version(self):
+        """Test that successful results for the same version are shared."""
+        doc = {
+            "openapi": "3.0.3",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {},
+        }
+        assert validate_openapi_with_pydantic(doc) is validate_openapi_with_pydantic(
+            dict(doc)
+        )
+
     def test_invalid_info_3_1(self):
         """Test that invalid info fails Pydantic validation for 3.1."""
         doc = {
@@ -244,6 +262,33 @@ paths: {}
         result = validate_document(doc, format_hint="yaml")
         assert result.is_valid
 
+    def test_validate_string_result_is_cached(self):
+        """Test that the same serialized payload reuses the cached result."""
+        doc = json.dumps(
+            {
+                "openapi": "3.0.3",
+                "info": {"title": "Cached API", "version": "1.0.0"},
+                "paths": {},
+            }
+        )
+        result = validate_document(doc)
+        assert validate_document(doc) is result
+        assert validate_document(doc.encode("utf-8")) is result
+
+    def test_validate_string_cached_errors_are_not_shared(self):
+        """Test that mutating a cached failure does not leak to later callers."""
+        doc = "not valid json or yaml: {{{{ shared"
+        first = validate_document(doc)
+        first.errors[0]["message"] = "changed"
+        second = validate_document(doc)
+        assert second is not first
+        assert second.errors[0]["message"] != "changed"
+
+    def test_validate_string_with_lone_surrogate(self):
+        """Test that strings which are not valid UTF-8 still validate."""
+        result = validate_document('{"openapi": "\ud800"}')
+        assert not result.is_valid
+
     def test_validate_invalid_parse(self):
         """Test that invalid content fails parsing."""
         result = validate_document("not valid json or yaml: {{{{")
@@ -302,6 +347,46 @@ class TestOpenAPIValidator:
         )
         assert result.is_valid
 
+    def test_validate_against_memoizes_same_document(self, validator_with_spec):
+        """Test that repeated validation of the same dict reuses the result."""
+        doc = {
+            "openapi": "3.1.0",
+            "info": {"title": "My API", "version": "2.0.0"},
+        }
+        with patch(
+            "ogcapi_registry.validator.validate_against_reference",
+            wraps=validate_against_reference,
+        ) as validate:
+            result = validator_with_spec.validate_against(
+                doc, SpecificationType.OPENAPI_3_0, "3.0.3"
+            )
+            assert not result.is_valid
+            again = validator_with_spec.validate_against(
+                doc, SpecificationType.OPENAPI_3_0, "3.0.3"
+            )
+            assert again == result
+            assert validate.call_count == 1
+
+            validator_with_spec.validate_against(
+                dict(doc), SpecificationType.OPENAPI_3_0, "3.0.3"
+            )
+            assert validate.call_count == 2
+
+    def test_validate_against_memo_does_not_share_errors(self, validator_with_spec):
+        """Test that mutating a memoized result does not leak to later callers."""
+        doc = {
+            "openapi": "3.1.0",
+            "info": {"title": "My API", "version": "2.0.0"},
+        }
+        first = validator_with_spec.validate_against(
+            doc, SpecificationType.OPENAPI_3_0, "3.0.3"
+        )
+        first.errors[0]["message"] = "changed"
+        second = validator_with_spec.validate_against(
+            doc, SpecificationType.OPENAPI_3_0, "3.0.3"
+        )
+        assert second.errors[0]["message"] != "changed"
+
     def test_validate_against_not_found(self, validator):
         """Test that validation against non-existent spec raises error."""
         doc = {
@@ -392,3 +477,48 @@ class TestCreateValidatorWithSpecs:
             "https://example.com/api-3.1.json",
         )
         assert len(validator.registry) == 2
+
+    def test_create_with_injected_client(self):
+        """Test that an injected client fetches every URL."""
+        content = {
+            "openapi": "3.0.3",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {},
+        }
+
+        class StubClient:
+            def __init__(self):
+                self.urls = []
+
+            def fetch(self, url):
+                return content, SpecificationMetadata(source_url=url)
+
+            def fetch_and_validate_structure(self, url):
+                self.urls.append(url)
+                return self.fetch(url)
+
+        client = StubClient()
+        urls = ("https://example.com/a.json", "https://example.com/b.json")
+        validator = create_validator_with_specs(*urls, client=client)
+        assert client.urls == list(urls)
+        assert len(validator.registry) == 1
+        spec = validator.registry.get(SpecificationType.OPENAPI_3_0, "3.0.3")
+        assert spec.metadata.source_url == urls[-1]
+
+    @pytest.mark.asyncio
+    async def test_create_inside_running_loop(self, httpx_mock):
+        """Test loading several URLs while an event loop is running."""
+        for version in ("3.0.3", "3.1.0"):
+            httpx_mock.add_response(
+                url=f"https://example.com/api-{version}.json",
+                content=json.dumps(
+                    {"openapi": version, "info": {"title": "API", "version": "1"}}
+                ).encode(),
+                headers={"content-type": "application/json"},
+            )
+
+        validator = create_validator_with_specs(
+            "https://example.com/api-3.0.3.json",
+            "https://example.com/api-3.1.0.json",
+        )
+        assert len(validator.registry) == 2